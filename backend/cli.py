@@ -1,11 +1,17 @@
 import argparse
+import copy
+import hashlib
+import importlib.util
+import json
 import os
 import sys
 import subprocess
 from pathlib import Path
 import logging
 import platform
+import shutil
 import time
+from typing import Any, Optional
 
 # Set up logging
 logging.basicConfig(
@@ -14,31 +20,87 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+_IS_MACOS = platform.system() == "Darwin"
+
+# Per-process Homebrew state, populated lazily by _ensure_brew/_brew_installed_set
+_BREW_OK: Optional[bool] = None
+_BREW_INSTALLED: Optional[frozenset[str]] = None
+
+# Round-trip and safe YAML parsers, and parsed configs keyed on (path, size, mtime, safe)
+_YAML_SINGLETON = None
+_YAML_SAFE_SINGLETON = None
+_CONF_CACHE: dict[tuple[str, int, float, bool], Any] = {}
+
+# Persistent cache location for values that are expensive to rediscover across runs
+CACHE_DIR = Path.home() / ".cache" / "open-llm-vtuber"
+OPENSSL_PREFIX_CACHE = CACHE_DIR / "openssl_prefix.json"
+RUN_STATE_CACHE = CACHE_DIR / "state.json"
+OPENAI_VERIFIED_CACHE = CACHE_DIR / "openai_verified.json"
+OPENAI_VERIFIED_TTL = 60 * 60  # seconds
+# Homebrew opt/ prefixes for Apple Silicon and Intel installs
+BREW_OPT_DIRS = [Path("/opt/homebrew/opt"), Path("/usr/local/opt")]
+
+# Delays between Ollama readiness probes after `ollama serve`
+OLLAMA_STARTUP_BACKOFF = [0.05, 0.1, 0.2, 0.4, 0.8, 1.6, 3.0]
+# Pooled HTTP session for Ollama health checks, created by _get_ollama_session
+_ollama_session = None
+
 def ensure_required_packages():
     """Ensure required packages are installed and imported"""
-    required_packages = ["ruamel.yaml", "requests"]
-    if not install_requirements(required_packages):
-        print("\n❌ Failed to install required packages")
-        return False
+    global yaml, yaml_safe, requests, _YAML_SINGLETON, _YAML_SAFE_SINGLETON
+    try:
+        import requests
+        from ruamel.yaml import YAML
+    except ImportError:
+        required_packages = ["ruamel.yaml", "requests"]
+        if not install_requirements(required_packages):
+            print("\n❌ Failed to install required packages")
+            return False
+        
+        # Import after installation
+        import requests
+        from ruamel.yaml import YAML
     
-    # Import after installation
-    global yaml, requests
-    import requests
-    from ruamel.yaml import YAML
-    yaml = YAML()
+    if _YAML_SINGLETON is None:
+        _YAML_SINGLETON = YAML()
+        # Plain dict/list loader for read-only consumers; skips comment/order bookkeeping
+        _YAML_SAFE_SINGLETON = YAML(typ='safe')
+    yaml = _YAML_SINGLETON
+    yaml_safe = _YAML_SAFE_SINGLETON
     return True
 
+def _load_conf(path, safe=False):
+    """Load a YAML config, reusing the parsed result while the file is unchanged
+
+    Use safe=True for read-only access; the round-trip loader is only needed
+    when the config is dumped back to disk.
+    """
+    path = str(path)
+    stat = os.stat(path)
+    key = (path, stat.st_size, stat.st_mtime, safe)
+    if key not in _CONF_CACHE:
+        loader = yaml_safe if safe else yaml
+        with open(path, 'r') as f:
+            _CONF_CACHE[key] = loader.load(f)
+    return _CONF_CACHE[key]
+
 def install_requirements(packages):
     """Install required packages"""
+    # Special handling for pydantic to ensure v1
+    normalized = ["pydantic<2.0" if package.startswith("pydantic") else package for package in packages]
+    # Skip bare package names that are already importable; pinned versions always go to pip
+    normalized = [
+        package for package in normalized
+        if any(c in package for c in "<>=!~") or not _module_available(package)
+    ]
+    if not normalized:
+        return True
     try:
-        for package in packages:
+        for package in normalized:
             print(f"\n📦 Installing {package}...")
-            # Special handling for pydantic to ensure v1
-            if package.startswith("pydantic"):
-                subprocess.run([sys.executable, "-m", "pip", "install", "pydantic<2.0"], check=True)
-            else:
-                subprocess.run([sys.executable, "-m", "pip", "install", package], check=True)
-            logger.debug(f"Successfully installed {package}")
+        # Single pip invocation for all packages to avoid repeated interpreter/resolver startup
+        subprocess.run([sys.executable, "-m", "pip", "install", *normalized], check=True)
+        logger.debug(f"Successfully installed {', '.join(normalized)}")
         return True
     except subprocess.CalledProcessError as e:
         logger.error(f"Failed to install requirements: {e}")
@@ -62,10 +124,8 @@ def get_default_paths():
 
 def check_uv_environment():
     """Check if uv is installed and set up virtual environment if needed"""
-    try:
-        # Check if uv is installed
-        subprocess.run(["uv", "--version"], check=True, capture_output=True)
-    except (subprocess.CalledProcessError, FileNotFoundError):
+    # Check if uv is installed
+    if shutil.which("uv") is None:
         print("\n❌ uv is not installed. Please install it first:")
         print("curl -LsSf https://astral.sh/uv/install.sh | sh")
         print("Or visit: https://github.com/astral/uv for other installation methods")
@@ -97,33 +157,54 @@ def prompt_language_choice():
         else:
             print("Invalid choice. Please enter 1 or 2.")
 
+def _ensure_brew():
+    """Check that Homebrew is on PATH, looking it up at most once per process"""
+    global _BREW_OK
+    if _BREW_OK is None:
+        _BREW_OK = shutil.which("brew") is not None
+    return _BREW_OK
+
+def _brew_installed_set():
+    """Return the set of installed Homebrew formulae, listed once per process"""
+    global _BREW_INSTALLED
+    if _BREW_INSTALLED is None:
+        result = subprocess.run(
+            ["brew", "list", "--formula", "-1"],
+            check=True,
+            capture_output=True,
+            text=True
+        )
+        _BREW_INSTALLED = frozenset(result.stdout.split())
+    return _BREW_INSTALLED
+
 def check_dependencies():
     """Check and install required system dependencies"""
     missing_deps = []
     
-    if platform.system() == "Darwin":  # macOS
-        try:
-            # Check Homebrew
-            subprocess.run(["brew", "--version"], check=True, capture_output=True)
-            
-            # Check other dependencies
-            for pkg in ["portaudio", "libsndfile"]:
-                try:
-                    subprocess.run(["brew", "list", pkg], check=True, capture_output=True)
-                except subprocess.CalledProcessError:
-                    missing_deps.append(pkg)
-                    
-        except (subprocess.CalledProcessError, FileNotFoundError):
+    if _IS_MACOS:
+        if not _ensure_brew():
             print("\n❌ Homebrew is required but not installed!")
             print("Please install Homebrew first:")
             print("/bin/bash -c \"$(curl -fsSL https://raw.githubusercontent.com/Homebrew/install/HEAD/install.sh)\"")
             sys.exit(1)
+        
+        try:
+            installed = _brew_installed_set()
+        except subprocess.CalledProcessError as e:
+            logger.error(f"Failed to list Homebrew formulae: {e}")
+            installed = frozenset()
+        
+        # Check other dependencies
+        for pkg in ["portaudio", "libsndfile"]:
+            if pkg not in installed:
+                missing_deps.append(pkg)
     
     return missing_deps
 
 def install_dependencies(missing_deps):
     """Install missing system dependencies"""
-    if platform.system() == "Darwin":  # macOS
+    global _BREW_INSTALLED
+    if _IS_MACOS:
         print("\n🔧 Installing missing dependencies...")
         for pkg in missing_deps:
             if pkg == "openssl@1.1":
@@ -134,6 +215,28 @@ def install_dependencies(missing_deps):
             except subprocess.CalledProcessError as e:
                 logger.error(f"Failed to install {pkg}: {e}")
                 return False
+            finally:
+                # Installed formulae changed; re-list on next check
+                _BREW_INSTALLED = None
+    return True
+
+def _ensure_env() -> bool:
+    """Create .env with the user's OpenAI API key if it does not exist yet"""
+    if Path(".env").exists():
+        return True
+    
+    print("\n⚠️ No .env file found. Creating one...")
+    api_key = input("Please enter your OpenAI API key: ").strip()
+    try:
+        with open(".env", "w") as f:
+            f.write(f"OPENAI_API_KEY={api_key}\n")
+    except OSError as e:
+        logger.error(f"Failed to create .env file: {str(e)}")
+        print("\n❌ Error creating .env file")
+        print("Please create it manually with your OpenAI API key")
+        return False
+    
+    print("✅ Created .env file with API key")
     return True
 
 def show_main_menu():
@@ -167,12 +270,8 @@ def setup_command():
         return
 
     # Check for .env and OpenAI API key
-    if not Path(".env").exists():
-        print("\n⚠️ No .env file found. Creating one...")
-        api_key = input("Please enter your OpenAI API key: ").strip()
-        with open(".env", "w") as f:
-            f.write(f"OPENAI_API_KEY={api_key}\n")
-        print("✅ Created .env file with API key")
+    if not _ensure_env():
+        return
 
     # Get language preference
     lang = prompt_language_choice()
@@ -185,30 +284,39 @@ def setup_command():
     # Load and modify config
     config_path = Path("conf.yaml")
     if config_path.exists():
-        with open(config_path, 'r') as f:
-            config = yaml.load(f)
-        
-        # Update LLM provider and model
-        config['character_config']['agent_config']['agent_settings']['basic_memory_agent']['llm_provider'] = llm_config['provider']
-        config['character_config']['agent_config']['llm_configs'][llm_config['provider']]['model'] = llm_config['model']
+        # _load_conf returns its cached instance; edit a copy so the cache
+        # only ever reflects what is on disk
+        config = copy.deepcopy(_load_conf(config_path))
+        agent_config = config['character_config']['agent_config']
+        memory_agent = agent_config['agent_settings']['basic_memory_agent']
+        provider_config = agent_config['llm_configs'][llm_config['provider']]
         
-        with open(config_path, 'w') as f:
-            yaml.dump(config, f)
+        # Update LLM provider and model, skipping the write if nothing changed
+        if (memory_agent.get('llm_provider') != llm_config['provider']
+                or provider_config.get('model') != llm_config['model']):
+            memory_agent['llm_provider'] = llm_config['provider']
+            provider_config['model'] = llm_config['model']
+            
+            # Dump to a temp file and rename so a failed write can't corrupt conf.yaml
+            tmp_path = config_path.with_name(config_path.name + ".tmp")
+            try:
+                with open(tmp_path, 'w') as f:
+                    yaml.dump(config, f)
+                os.replace(tmp_path, config_path)
+            except Exception:
+                tmp_path.unlink(missing_ok=True)
+                raise
     
     print("\n✅ Configuration complete!")
     print(f"Selected LLM: {llm_config['provider']} with model {llm_config['model']}")
 
 def check_ollama_installed():
     """Check if Ollama is installed"""
-    try:
-        subprocess.run(["ollama", "version"], check=True, capture_output=True)
-        return True
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return False
+    return shutil.which("ollama") is not None
 
 def install_ollama():
     """Install Ollama"""
-    if platform.system() == "Darwin":  # macOS
+    if _IS_MACOS:
         try:
             print("\n📦 Installing Ollama...")
             subprocess.run(["brew", "install", "ollama"], check=True)
@@ -247,8 +355,17 @@ def build_command():
         base_dir / "logs",
     ]
     
+    # List each parent once instead of stat-ing every required path
+    existing = set()
+    for parent in {directory.parent for directory in required_dirs}:
+        try:
+            with os.scandir(parent) as entries:
+                existing.update(Path(entry.path) for entry in entries if entry.is_dir())
+        except FileNotFoundError:
+            continue
+    
     for directory in required_dirs:
-        if not directory.exists():
+        if directory not in existing:
             directory.mkdir(parents=True, exist_ok=True)
             print(f"\nCreated directory: {directory}")
 
@@ -272,25 +389,8 @@ def build_command():
                 return
 
     # Check for .env file and OpenAI API key
-    if not Path(".env").exists():
-        print("\n⚠️ No .env file found. Creating one...")
-        api_key = input("Please enter your OpenAI API key: ").strip()
-        try:
-            with open(".env", "w") as f:
-                f.write(f"OPENAI_API_KEY={api_key}\n")
-            print("✅ Created .env file with API key")
-            
-            # Verify the file was written correctly
-            with open(".env", "r") as f:
-                content = f.read().strip()
-            if not content.startswith("OPENAI_API_KEY="):
-                raise Exception("Failed to write API key correctly")
-                
-        except Exception as e:
-            logger.error(f"Failed to create .env file: {str(e)}")
-            print("\n❌ Error creating .env file")
-            print("Please create it manually with your OpenAI API key")
-            return
+    if not _ensure_env():
+        return
     
     # Create and setup Python virtual environment
     print("\n🔧 Setting up Python environment...")
@@ -301,7 +401,6 @@ def build_command():
         choice = input("Would you like to recreate it? (y/n): ").lower()
         if choice == 'y':
             try:
-                import shutil
                 shutil.rmtree(venv_path)
                 print("Removed existing virtual environment.")
             except Exception as e:
@@ -315,26 +414,18 @@ def build_command():
         subprocess.run(["uv", "venv"], check=True)
         print("✅ Virtual environment created")
         
-        # Install dependencies using UV
+        # Install dependencies using UV (uv resolves and installs without pip)
         print("\nInstalling Python dependencies...")
-        subprocess.run(["uv", "pip", "install", "--upgrade", "pip"], check=True)
         
         # Install project in editable mode
         subprocess.run(["uv", "pip", "install", "-e", "."], check=True)
         print("✅ Dependencies installed")
         
         # Verify core dependencies
-        try:
-            subprocess.run([
-                str(venv_path / "bin" / "python"), 
-                "-c", 
-                """
-import uvicorn, ruamel.yaml, numpy, torch, requests, openai
-from dotenv import load_dotenv
-                """.strip()
-            ], check=True)
+        core_modules = ["uvicorn", "ruamel.yaml", "numpy", "torch", "requests", "openai", "dotenv"]
+        if _probe_deps(_venv_python(venv_path), core_modules):
             print("\n✅ Core dependencies verified")
-        except subprocess.CalledProcessError:
+        else:
             print("\n⚠️ Some dependencies may be missing.")
             print("Please try running the build command again.")
             return
@@ -350,34 +441,74 @@ from dotenv import load_dotenv
     print("1. Run 'python cli.py setup' to create configuration")
     print("2. Run 'python cli.py run' to start the server")
 
-def find_venv():
-    """Find and validate virtual environment"""
-    venv_paths = [
-        Path(".venv"),
-        Path("venv"),
-        Path(os.environ.get("VIRTUAL_ENV", ""))
-    ]
+def _venv_bin(venv_path, name):
+    """Return the path of an executable inside a virtual environment for this platform"""
+    if os.name == "nt":
+        return venv_path / "Scripts" / f"{name}.exe"
+    return venv_path / "bin" / name
+
+def _venv_python(venv_path):
+    """Return the interpreter path inside a virtual environment for this platform"""
+    return _venv_bin(venv_path, "python")
+
+def _venv_uv(venv_path):
+    """Return the venv's own uv, or the one on PATH (uv venv doesn't install itself)"""
+    uv_bin = _venv_bin(venv_path, "uv")
+    return str(uv_bin) if os.path.isfile(uv_bin) else "uv"
+
+def _locate_venv() -> Optional[tuple[Path, Path]]:
+    """Find a virtual environment, returning (venv_root, python_bin)"""
+    venv_paths = [Path(".venv"), Path("venv")]
+    if os.environ.get("VIRTUAL_ENV"):
+        venv_paths.append(Path(os.environ["VIRTUAL_ENV"]))
     
     for venv_path in venv_paths:
-        if venv_path.exists() and (venv_path / "bin" / "python").exists():
+        python_bin = _venv_python(venv_path)
+        if os.path.isfile(python_bin):
             logger.debug(f"Found virtual environment at: {venv_path}")
-            return venv_path
+            return venv_path, python_bin
     
     return None
 
-def verify_dependencies(venv_path):
+def _module_available(name):
+    """Locate a module without importing it"""
+    try:
+        return importlib.util.find_spec(name) is not None
+    except ModuleNotFoundError:  # Parent package of a dotted name is missing
+        return False
+
+def _probe_deps(python_bin, modules):
+    """Check that modules are importable by a venv's interpreter without importing them"""
+    # Compare prefixes rather than resolved binaries: every venv's python symlinks
+    # back to the same base interpreter
+    venv_path = python_bin.parent.parent
+    if Path(sys.prefix).resolve() == venv_path.resolve():
+        return all(_module_available(name) for name in modules)
+    
+    # Foreign interpreter: probe with find_spec in the child too, so heavy modules
+    # like torch are located but never initialised
+    probe = (
+        "import importlib.util, sys\n"
+        "def available(name):\n"
+        "    try:\n"
+        "        return importlib.util.find_spec(name) is not None\n"
+        "    except ModuleNotFoundError:\n"
+        "        return False\n"
+        f"sys.exit(0 if all(available(m) for m in {list(modules)!r}) else 1)\n"
+    )
+    result = subprocess.run(
+        [str(python_bin), "-c", probe],
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL
+    )
+    return result.returncode == 0
+
+def verify_dependencies(python_bin):
     """Verify required dependencies are installed"""
     logger.debug("Verifying dependencies...")
     
     try:
-        # Try importing key dependencies
-        result = subprocess.run(
-            [str(venv_path / "bin" / "python"), "-c", 
-             "import uvicorn, yaml, numpy, torch"],
-            capture_output=True,
-            text=True
-        )
-        if result.returncode == 0:
+        if _probe_deps(python_bin, ["uvicorn", "yaml", "numpy", "torch"]):
             logger.debug("Core dependencies verified")
             return True
     except Exception as e:
@@ -385,6 +516,57 @@ def verify_dependencies(venv_path):
     
     return False
 
+def _openssl_opt_mtime(formula):
+    """Return the mtime of a formula's Homebrew opt/ link, or None if not found"""
+    for opt_dir in BREW_OPT_DIRS:
+        try:
+            return os.stat(opt_dir / formula).st_mtime
+        except OSError:
+            continue
+    return None
+
+def _openssl_prefix(formula: str) -> Optional[str]:
+    """Resolve `brew --prefix <formula>`, cached on disk until the formula is reinstalled"""
+    mtime = _openssl_opt_mtime(formula)
+    try:
+        cache = json.loads(OPENSSL_PREFIX_CACHE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    
+    entry = cache.get(formula)
+    if mtime is not None and entry and entry.get("mtime") == mtime:
+        return entry["path"]
+    
+    try:
+        prefix = subprocess.check_output(["brew", "--prefix", formula], text=True).strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return None
+    
+    if mtime is not None:
+        cache[formula] = {"path": prefix, "mtime": mtime}
+        try:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            OPENSSL_PREFIX_CACHE.write_text(json.dumps(cache))
+        except OSError as e:
+            logger.debug(f"Could not write OpenSSL prefix cache: {e}")
+    return prefix
+
+def _pyenv_version_has_openssl3(version):
+    """Check whether pyenv's build of a Python version is linked against OpenSSL 3"""
+    try:
+        installed = subprocess.check_output(["pyenv", "versions", "--bare"], text=True).split()
+        if version not in installed:
+            return False
+        prefix = subprocess.check_output(["pyenv", "prefix", version], text=True).strip()
+        ssl_version = subprocess.check_output(
+            [str(Path(prefix) / "bin" / "python"), "-c", "import ssl; print(ssl.OPENSSL_VERSION)"],
+            text=True
+        )
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return False
+    logger.debug(f"pyenv Python {version} OpenSSL version: {ssl_version.strip()}")
+    return "OpenSSL 3" in ssl_version
+
 def rebuild_python_with_openssl():
     """Rebuild Python with the correct OpenSSL version"""
     print("\n🔧 Rebuilding Python with OpenSSL...")
@@ -394,18 +576,21 @@ def rebuild_python_with_openssl():
         logger.debug(f"Current Python version: {current_version}")
         
         # Install pyenv if not present
-        try:
-            subprocess.run(["pyenv", "--version"], check=True, capture_output=True)
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        if shutil.which("pyenv") is None:
             print("Installing pyenv...")
             subprocess.run(["brew", "install", "pyenv"], check=True)
         
+        # Skip the rebuild if pyenv already has this version linked against OpenSSL 3
+        if _pyenv_version_has_openssl3(current_version):
+            print(f"Python {current_version} is already built with OpenSSL 3")
+            subprocess.run(["pyenv", "global", current_version], check=True)
+            return True
+        
         # Set OpenSSL environment variables for Python build
         build_env = os.environ.copy()
-        openssl_path = subprocess.check_output(
-            ["brew", "--prefix", "openssl@3"],
-            text=True
-        ).strip()
+        openssl_path = _openssl_prefix("openssl@3")
+        if openssl_path is None:
+            raise RuntimeError("OpenSSL 3 not found via Homebrew")
         
         build_env.update({
             "PYTHON_CONFIGURE_OPTS": f"--with-openssl={openssl_path}",
@@ -441,6 +626,15 @@ def verify_ssl():
         logger.error(f"SSL verification failed: {e}")
     return False
 
+def _get_ollama_session():
+    """Return a shared session so repeated Ollama probes reuse one loopback connection"""
+    global _ollama_session
+    if _ollama_session is None:
+        from requests.adapters import HTTPAdapter
+        _ollama_session = requests.Session()
+        _ollama_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=1))
+    return _ollama_session
+
 def check_ollama():
     """Check if Ollama is installed and running"""
     # First check if Ollama is installed
@@ -456,17 +650,18 @@ def check_ollama():
             return False
 
     # Check if server is running first
+    session = _get_ollama_session()
     try:
-        requests.get("http://localhost:11434/api/version", timeout=2)
+        session.get("http://localhost:11434/api/version", timeout=2)
         print("✅ Ollama server is running")
-    except:
+    except requests.RequestException:
         print("\n⚠️ Ollama server is not running")
         choice = input("Would you like to start the Ollama server now? (y/n): ").lower()
         if choice == 'y':
             try:
                 print("Starting Ollama server...")
                 # Start ollama server in background
-                if platform.system() == "Darwin":  # macOS
+                if _IS_MACOS:
                     subprocess.Popen(["ollama", "serve"], 
                                    stdout=subprocess.DEVNULL,
                                    stderr=subprocess.DEVNULL)
@@ -476,14 +671,16 @@ def check_ollama():
                                    stderr=subprocess.DEVNULL,
                                    start_new_session=True)
                 
-                # Wait for server to start
-                for _ in range(10):  # Try for 10 seconds
+                # Wait for server to start, probing quickly at first and backing off
+                # (~6s of sleeps plus probe timeouts stays within a 10 second budget)
+                for delay in OLLAMA_STARTUP_BACKOFF:
+                    time.sleep(delay)
                     try:
-                        requests.get("http://localhost:11434/api/version", timeout=1)
+                        session.get("http://localhost:11434/api/version", timeout=0.5)
                         print("✅ Ollama server started successfully!")
                         break
-                    except:
-                        time.sleep(1)
+                    except requests.RequestException:
+                        continue
                 else:  # Server didn't start
                     print("❌ Failed to start Ollama server")
                     return False
@@ -497,8 +694,10 @@ def check_ollama():
     # Now check if the model is pulled
     try:
         print("\nChecking for required model...")
-        result = subprocess.run(["ollama", "list"], check=True, capture_output=True, text=True)
-        if "qwen2.5" not in result.stdout:
+        response = session.get("http://localhost:11434/api/tags", timeout=2)
+        response.raise_for_status()
+        installed = {model["name"].split(":")[0] for model in response.json().get("models", [])}
+        if "qwen2.5" not in installed:
             print("\n📥 Pulling required model (qwen2.5)...")
             try:
                 subprocess.run(["ollama", "pull", "qwen2.5"], check=True)
@@ -509,7 +708,7 @@ def check_ollama():
                 return False
         else:
             print("✅ Required model is already installed")
-    except subprocess.CalledProcessError as e:
+    except (requests.RequestException, ValueError) as e:
         print(f"\n❌ Failed to check models: {e}")
         print("Please ensure the Ollama server is running properly")
         return False
@@ -523,26 +722,76 @@ def verify_openai_key():
         logger.error("OpenAI API key not found in environment variables")
         return False
     
+    # Reuse a recent positive result; only a hash of the key is ever stored
+    key_hash = hashlib.sha256(key.encode()).hexdigest()
     try:
-        from openai import OpenAI
-        client = OpenAI(api_key=key)
-        logger.debug("Created OpenAI client")
-        
-        # Test API connection
-        try:
-            models = client.models.list()
-            logger.debug("Successfully connected to OpenAI API")
-            return True
-        except Exception as e:
-            logger.error(f"Failed to list models: {str(e)}")
-            return False
-            
-    except ImportError as e:
-        logger.error(f"Failed to import OpenAI package: {str(e)}")
-        return False
-    except Exception as e:
-        logger.error(f"Unexpected error verifying OpenAI key: {str(e)}")
+        cache = json.loads(OPENAI_VERIFIED_CACHE.read_text())
+    except (OSError, ValueError):
+        cache = {}
+    if time.time() - cache.get(key_hash, 0) < OPENAI_VERIFIED_TTL:
+        logger.debug("OpenAI API key verified recently; skipping check")
+        return True
+    
+    # Test API connection; only the status code matters, so the body is never read
+    try:
+        with requests.get(
+            "https://api.openai.com/v1/models",
+            headers={"Authorization": f"Bearer {key}"},
+            timeout=3,
+            stream=True
+        ) as response:
+            if response.status_code != 200:
+                logger.error(f"OpenAI API rejected the key (HTTP {response.status_code})")
+                return False
+    except requests.RequestException as e:
+        logger.error(f"Failed to reach OpenAI API: {str(e)}")
         return False
+    
+    logger.debug("Successfully connected to OpenAI API")
+    cache[key_hash] = time.time()
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        OPENAI_VERIFIED_CACHE.write_text(json.dumps(cache))
+    except OSError as e:
+        logger.debug(f"Could not write OpenAI verification cache: {e}")
+    return True
+
+def _mtime(path):
+    """Return a path's mtime, or None if it does not exist"""
+    try:
+        return os.stat(path).st_mtime
+    except (OSError, TypeError):
+        return None
+
+def _run_fingerprint(venv_path):
+    """Describe everything the run-time environment checks depend on"""
+    if os.name == "nt":
+        site_packages = venv_path / "Lib" / "site-packages"
+    else:
+        site_packages = next(iter(sorted(venv_path.glob("lib/python*/site-packages"))), None)
+    return {
+        "venv_path": str(venv_path.resolve()),
+        "venv_mtime": _mtime(site_packages or venv_path),
+        "conf_mtime": _mtime("conf.yaml"),
+        "brew_bin_mtime": _mtime(shutil.which("brew")),
+        "python_executable": sys.executable,
+        "python_version": platform.python_version(),
+    }
+
+def _load_run_state():
+    """Load the state recorded by the last fully verified run"""
+    try:
+        return json.loads(RUN_STATE_CACHE.read_text())
+    except (OSError, ValueError):
+        return {}
+
+def _save_run_state(state):
+    """Record a fully verified run so the next one can skip environment checks"""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        RUN_STATE_CACHE.write_text(json.dumps(state))
+    except OSError as e:
+        logger.debug(f"Could not write run state cache: {e}")
 
 def run_command():
     """Handle the run command - start the server"""
@@ -560,8 +809,7 @@ def run_command():
     
     # Check OpenAI API key if using OpenAI
     try:
-        with open("conf.yaml") as f:
-            config = yaml.load(f)
+        config = _load_conf("conf.yaml", safe=True)
         
         llm_provider = config['character_config']['agent_config']['agent_settings']['basic_memory_agent']['llm_provider']
         logger.debug(f"Using LLM provider: {llm_provider}")
@@ -593,74 +841,81 @@ def run_command():
         print("Please run 'python cli.py setup' first")
         return
     
-    # Verify SSL is working
-    if not verify_ssl():
-        print("\n⚠️ SSL is not working properly.")
-        if platform.system() == "Darwin":
-            print("This might be due to Python being built against the wrong OpenSSL version.")
-            choice = input("Would you like to rebuild Python with OpenSSL 3? (y/n): ").lower()
-            if choice == 'y':
-                if rebuild_python_with_openssl():
-                    print("\n✅ Python rebuilt successfully. Please restart the CLI.")
-                    return
+    # Skip SSL, venv and dependency checks when nothing changed since the last verified run
+    venv = _locate_venv()
+    venv_path, python_path = venv if venv else (None, None)
+    state = _load_run_state()
+    warm = (
+        venv_path is not None
+        and state.get("ssl_ok")
+        and state.get("fingerprint") == _run_fingerprint(venv_path)
+    )
+    
+    if warm:
+        logger.debug("Environment unchanged since last verified run; skipping checks")
+    else:
+        # Verify SSL is working
+        ssl_ok = verify_ssl()
+        if not ssl_ok:
+            print("\n⚠️ SSL is not working properly.")
+            if _IS_MACOS:
+                print("This might be due to Python being built against the wrong OpenSSL version.")
+                choice = input("Would you like to rebuild Python with OpenSSL 3? (y/n): ").lower()
+                if choice == 'y':
+                    if rebuild_python_with_openssl():
+                        print("\n✅ Python rebuilt successfully. Please restart the CLI.")
+                        return
+                    else:
+                        print("\n❌ Failed to rebuild Python.")
+                        return
                 else:
-                    print("\n❌ Failed to rebuild Python.")
-                    return
-            else:
-                print("\n⚠️ Continuing without rebuilding Python...")
-    
-    # Find virtual environment
-    venv_path = find_venv()
-    if not venv_path:
-        print("\n❌ No virtual environment found!")
-        print("Running build to create environment...")
-        build_command()
-        venv_path = find_venv()
-        if not venv_path:
-            print("\n❌ Failed to create virtual environment")
-            return
+                    print("\n⚠️ Continuing without rebuilding Python...")
     
-    # Verify dependencies
-    if not verify_dependencies(venv_path):
-        print("\n⚠️ Some dependencies are missing.")
-        choice = input("Would you like to install missing dependencies? (y/n): ").lower()
-        if choice == 'y':
-            try:
-                print("\nInstalling dependencies...")
-                subprocess.run(
-                    [str(venv_path / "bin" / "uv"), "pip", "install", "-e", "."],
-                    check=True
-                )
-                print("✅ Dependencies installed")
-            except subprocess.CalledProcessError as e:
-                logger.error(f"Failed to install dependencies: {e}")
-                print("\n❌ Failed to install dependencies")
+        # Find virtual environment
+        if not venv_path:
+            print("\n❌ No virtual environment found!")
+            print("Running build to create environment...")
+            build_command()
+            venv = _locate_venv()
+            if not venv:
+                print("\n❌ Failed to create virtual environment")
                 return
-        else:
-            print("\n⚠️ Continuing without installing dependencies...")
+            venv_path, python_path = venv
+    
+        # Verify dependencies
+        deps_ok = verify_dependencies(python_path)
+        if not deps_ok:
+            print("\n⚠️ Some dependencies are missing.")
+            choice = input("Would you like to install missing dependencies? (y/n): ").lower()
+            if choice == 'y':
+                try:
+                    print("\nInstalling dependencies...")
+                    subprocess.run(
+                        [_venv_uv(venv_path), "pip", "install", "-e", "."],
+                        check=True
+                    )
+                    print("✅ Dependencies installed")
+                    deps_ok = True
+                except subprocess.CalledProcessError as e:
+                    logger.error(f"Failed to install dependencies: {e}")
+                    print("\n❌ Failed to install dependencies")
+                    return
+            else:
+                print("\n⚠️ Continuing without installing dependencies...")
     
     print("\n🚀 Starting server...")
     try:
         # Add environment variables for OpenSSL
         env = os.environ.copy()
-        if platform.system() == "Darwin":
-            try:
-                # Try OpenSSL 3 first
-                openssl_path = subprocess.check_output(
-                    ["brew", "--prefix", "openssl@3"],
-                    text=True
-                ).strip()
-            except subprocess.CalledProcessError:
-                try:
-                    # Fallback to OpenSSL 1.1
-                    openssl_path = subprocess.check_output(
-                        ["brew", "--prefix", "openssl@1.1"],
-                        text=True
-                    ).strip()
-                except subprocess.CalledProcessError:
-                    logger.error("Neither OpenSSL 3 nor 1.1 found")
-                    print("\n❌ OpenSSL not found. Please run build command first.")
-                    return
+        if _IS_MACOS:
+            # Try OpenSSL 3 first, falling back to OpenSSL 1.1
+            openssl_path = state.get("openssl_path") if warm else None
+            if openssl_path is None:
+                openssl_path = _openssl_prefix("openssl@3") or _openssl_prefix("openssl@1.1")
+            if openssl_path is None:
+                logger.error("Neither OpenSSL 3 nor 1.1 found")
+                print("\n❌ OpenSSL not found. Please run build command first.")
+                return
                 
             logger.debug(f"Using OpenSSL from: {openssl_path}")
             
@@ -676,15 +931,21 @@ def run_command():
             
             logger.debug("OpenSSL environment variables set")
         
+        if not warm and ssl_ok and deps_ok:
+            _save_run_state({
+                "fingerprint": _run_fingerprint(venv_path),
+                "ssl_ok": True,
+                "openssl_path": openssl_path if _IS_MACOS else None,
+            })
+        
         # Run server using the virtual environment's Python
-        python_path = venv_path / "bin" / "python"
         subprocess.run([str(python_path), "run_server.py"], env=env, check=True)
         
     except subprocess.CalledProcessError as e:
         logger.error(f"Server startup failed: {e}")
         print(f"\n❌ Error starting server: {e}")
         
-        if platform.system() == "Darwin":
+        if _IS_MACOS:
             print("\nTry running 'python cli.py build' to fix dependency issues")
             
     except KeyboardInterrupt:
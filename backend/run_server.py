@@ -2,6 +2,7 @@ import os
 import sys
 import atexit
 import argparse
+import importlib.util
 from pathlib import Path
 import tomli
 import uvicorn
@@ -81,10 +82,14 @@ def run(console_log_level: str = "INFO") -> None:
     config = load_config()
     server_config = config.system_config
 
-    # Convert paths to absolute paths relative to BASE_DIR
-    server_config.live2d_models_dir = str(BASE_DIR / server_config.live2d_models_dir)
-    server_config.shared_assets_dir = str(BASE_DIR / server_config.shared_assets_dir)
-    server_config.cache_dir = str(BASE_DIR / server_config.cache_dir)
+    # Convert paths to absolute paths relative to BASE_DIR (the config is frozen)
+    server_config = config.system_config = server_config.model_copy(
+        update={
+            "live2d_models_dir": str(BASE_DIR / server_config.live2d_models_dir),
+            "shared_assets_dir": str(BASE_DIR / server_config.shared_assets_dir),
+            "cache_dir": str(BASE_DIR / server_config.cache_dir),
+        }
+    )
 
     # Ensure directories exist
     Path(server_config.live2d_models_dir).mkdir(parents=True, exist_ok=True)
@@ -127,11 +132,21 @@ def run(console_log_level: str = "INFO") -> None:
         config=config,
     )
 
+    if sys.platform != "win32" and importlib.util.find_spec("uvloop") is None:
+        logger.warning(
+            "uvloop is not installed; serving on the default asyncio event loop"
+        )
+
     uvicorn.run(
         app=server.app,
         host=server_config.host,
         port=server_config.port,
         log_level=console_log_level.lower(),
+        # uvloop when importable (uvicorn[standard] installs it everywhere but
+        # Windows), else the stock asyncio loop; likewise the C httptools
+        # parser for HTTP, with the pure-Python h11 as fallback
+        loop="auto",
+        http="auto",
     )
 
 
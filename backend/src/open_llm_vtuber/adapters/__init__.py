@@ -1,7 +1,7 @@
 """Backend adapters for different backend modes"""
 
-from .base_adapter import BackendAdapter
+from .base_adapter import ADAPTERS, AdapterError, BackendAdapter, register
 from .orphiq_adapter import OrphiqAdapter
 
-__all__ = ["BackendAdapter", "OrphiqAdapter"]
+__all__ = ["ADAPTERS", "AdapterError", "BackendAdapter", "OrphiqAdapter", "register"]
 
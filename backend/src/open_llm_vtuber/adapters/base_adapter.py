@@ -1,13 +1,38 @@
 """Base adapter interface for backend abstraction"""
 
-from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any, AsyncIterator
+from typing import (
+    Optional,
+    Dict,
+    Any,
+    AsyncIterator,
+    Callable,
+    Protocol,
+    TypeVar,
+    runtime_checkable,
+)
 
+import orjson
 
-class BackendAdapter(ABC):
-    """Base interface for all backend adapters"""
+# Everything in a text-generation-chunk frame but the text is constant
+_CHUNK_FRAME_HEAD = b'{"type":"text-generation-chunk","text":'
+_CHUNK_FRAME_TAIL = b',"is_complete":false}'
+
+
+class AdapterError(Exception):
+    """Raised when an adapter fails to carry out a command"""
+
+
+@runtime_checkable
+class BackendAdapter(Protocol):
+    """
+    Base interface for all backend adapters
+
+    Structural: any object with these methods is an adapter. Subclass it
+    explicitly to inherit generate_text_frames and close.
+    """
+
+    __slots__ = ()
 
-    @abstractmethod
     async def generate_text(
         self,
         prompt: str,
@@ -23,9 +48,40 @@ class BackendAdapter(ABC):
         Yields:
             str: Text chunks as they are generated
         """
-        pass
+        ...
+
+    async def generate_text_frames(
+        self,
+        prompt: str,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[bytes]:
+        """
+        Generate text response as ready-to-send WebSocket frames
+
+        Each chunk from generate_text is encoded once into a
+        text-generation-chunk frame, followed by a final
+        text-generation-response frame carrying the full text. Coalescing
+        chunks is left to generate_text (see OrphiqAdapter.generate_text).
+
+        Args:
+            prompt: Input prompt text
+            context: Optional context dictionary
+
+        Yields:
+            bytes: JSON-encoded frames
+        """
+        chunks = []
+        async for text in self.generate_text(prompt, context):
+            chunks.append(text)
+            yield _CHUNK_FRAME_HEAD + orjson.dumps(text) + _CHUNK_FRAME_TAIL
+        yield orjson.dumps(
+            {
+                "type": "text-generation-response",
+                "text": "".join(chunks),
+                "is_complete": True,
+            }
+        )
 
-    @abstractmethod
     async def trigger_expression(
         self,
         expression_id: int,
@@ -42,10 +98,12 @@ class BackendAdapter(ABC):
 
         Returns:
             dict: Result dictionary with status information
+
+        Raises:
+            AdapterError: If the command could not be sent
         """
-        pass
+        ...
 
-    @abstractmethod
     async def trigger_motion(
         self,
         motion_group: str,
@@ -64,10 +122,12 @@ class BackendAdapter(ABC):
 
         Returns:
             dict: Result dictionary with status information
+
+        Raises:
+            AdapterError: If the command could not be sent
         """
-        pass
+        ...
 
-    @abstractmethod
     async def get_character_state(self) -> Dict[str, Any]:
         """
         Get current character state
@@ -75,5 +135,31 @@ class BackendAdapter(ABC):
         Returns:
             dict: Current character state information
         """
+        ...
+
+    async def close(self) -> None:
+        """
+        Release resources held by the adapter (background tasks, queues).
+        Called when the adapter is discarded; the default does nothing.
+        """
         pass
 
+
+# Adapter classes keyed on backend mode name, filled in by @register
+ADAPTERS: Dict[str, type] = {}
+
+_A = TypeVar("_A", bound=type)
+
+
+def register(mode: str) -> Callable[[_A], _A]:
+    """
+    Register an adapter class for a backend mode
+
+    The class is constructed as cls(service_context=..., websocket_send=...).
+    """
+
+    def decorator(cls: _A) -> _A:
+        ADAPTERS[mode] = cls
+        return cls
+
+    return decorator
@@ -1,34 +1,236 @@
 """Orphiq backend adapter - wraps existing orphiq functionality"""
 
-import json
-from typing import Optional, Dict, Any, AsyncIterator, Callable, Awaitable
+import asyncio
+import time
+import weakref
+from functools import lru_cache
+from typing import Optional, Dict, Any, AsyncIterator, Callable, Awaitable, Tuple
+
+import orjson
 from loguru import logger
 
-from .base_adapter import BackendAdapter
+from .base_adapter import AdapterError, BackendAdapter, register
 from ..service_context import ServiceContext
 from ..conversations.conversation_utils import create_batch_input
-from ..agent.output_types import SentenceOutput, AudioOutput
+from ..agent.output_types import Actions, SentenceOutput, AudioOutput
+
+# Coalesce streamed text until a sentence ends, this many characters are buffered,
+# or this many milliseconds have passed since the first buffered chunk
+BATCH_BYTES = 256
+BATCH_MS = 15
+_SENTENCE_ENDINGS = (".", "!", "?", "。", "！", "？", "\n")
+
+# Text carried by each agent output type, looked up by exact type
+_TEXT_EXTRACTORS: Dict[type, Callable[[Any], str]] = {
+    SentenceOutput: lambda output: output.display_text.text,
+    AudioOutput: lambda output: output.transcript,
+}
+
+# Extracted text is read ahead of the batching loop through a queue this deep
+PIPELINE_DEPTH = 8
+_END = object()
+
+# Outgoing frames are queued for a single writer task, which drains up to
+# WRITER_BATCH frames per wake-up
+WRITER_QUEUE_SIZE = 256
+WRITER_BATCH = 32
+
+
+def _extract_text(output: Any) -> Optional[str]:
+    """Text carried by an agent output, or None for unknown output types"""
+    extractor = _TEXT_EXTRACTORS.get(type(output))
+    if extractor is None:
+        # Subclasses miss the exact-type lookup; fall back to isinstance
+        extractor = next(
+            (fn for cls, fn in _TEXT_EXTRACTORS.items() if isinstance(output, cls)),
+            None,
+        )
+        if extractor is None:
+            logger.opt(lazy=True).warning(
+                "Unknown output type: {}", lambda: type(output).__name__
+            )
+            return None
+    return extractor(output)
+
+
+# Static part of the expression payload (an audio message without audio)
+_EXPR_TEMPLATE: Dict[str, Any] = {
+    "type": "audio",
+    "audio": None,
+    "volumes": [],
+    "slice_length": 20,
+    "forwarded": False,
+}
+
+# Encoded expression frames per character config, keyed by id and shared by
+# every adapter serving that config; an entry is dropped with its config.
+# Frames are keyed on (type, expression_id) so 1, 1.0 and True stay apart.
+_EXPR_FRAMES: Dict[int, Dict[Tuple[type, Any], bytes]] = {}
+
+
+def _expr_frames_for(character_config: Any) -> Dict[Tuple[type, Any], bytes]:
+    """The shared expression frame cache for a character config"""
+    key = id(character_config)
+    frames = _EXPR_FRAMES.get(key)
+    if frames is None:
+        frames = _EXPR_FRAMES[key] = {}
+        weakref.finalize(character_config, _EXPR_FRAMES.pop, key, None)
+    return frames
+
 
+@lru_cache(maxsize=64, typed=True)
+def _actions_for_expr(expression_id: int) -> Dict[str, Any]:
+    """Serialized actions for an expression; shared, so treat as read-only"""
+    return Actions(expressions=[expression_id]).to_dict()
 
+
+def _motion_frame(
+    motion_group: str, motion_index: int, loop: bool, priority: int
+) -> bytes:
+    """Encoded motion-command payload, cached for hashable arguments"""
+    try:
+        return _cached_motion_frame(motion_group, motion_index, loop, priority)
+    except TypeError:
+        # Unhashable values from a client message; encode without caching
+        return _cached_motion_frame.__wrapped__(
+            motion_group, motion_index, loop, priority
+        )
+
+
+@lru_cache(maxsize=128, typed=True)
+def _cached_motion_frame(
+    motion_group: str, motion_index: int, loop: bool, priority: int
+) -> bytes:
+    return orjson.dumps(
+        {
+            "type": "motion-command",
+            "motion_group": motion_group,
+            "motion_index": motion_index,
+            "loop": loop,
+            "priority": priority,
+        }
+    )
+
+
+@register("orphiq")
 class OrphiqAdapter(BackendAdapter):
     """Adapter for existing orphiq backend"""
 
+    # One adapter per connection; slots keep instances small and dict-free
+    __slots__ = (
+        "context",
+        "websocket_send",
+        "_current_expression",
+        "_current_motion",
+        "_expr_frames",
+        "_expr_owner",
+        "_static_state",
+        "_static_owner",
+        "_out_q",
+        "_writer",
+        "_send_error",
+    )
+
     def __init__(
         self,
         service_context: ServiceContext,
-        websocket_send: Callable[[str], Awaitable[None]],
+        websocket_send: Callable[[bytes | str], Awaitable[None]],
     ):
         """
         Initialize Orphiq adapter
 
         Args:
             service_context: Service context with all engines
-            websocket_send: Function to send WebSocket messages
+            websocket_send: Function to send WebSocket messages; accepts
+                pre-encoded JSON bytes as well as str
         """
         self.context = service_context
         self.websocket_send = websocket_send
         self._current_expression: Optional[int] = None
         self._current_motion: Optional[Dict[str, Any]] = None
+        # Encoded expression frames for _expr_owner, shared with other adapters
+        self._expr_frames: Dict[Tuple[type, Any], bytes] = {}
+        self._expr_owner: Any = None
+        # Config-derived part of get_character_state, keyed on the config objects
+        self._static_state: Dict[str, Any] = {}
+        self._static_owner: tuple = ()
+        self._out_q: asyncio.Queue[bytes] = asyncio.Queue(maxsize=WRITER_QUEUE_SIZE)
+        self._writer: Optional[asyncio.Task] = None
+        # First send failure seen by the writer; the connection is unusable after it
+        self._send_error: Optional[Exception] = None
+
+    async def _enqueue(self, frame: bytes) -> None:
+        """
+        Queue a pre-encoded frame for the writer task, starting it if needed
+
+        Raises:
+            AdapterError: If an earlier frame failed to send
+        """
+        if self._send_error is not None:
+            raise AdapterError(
+                f"WebSocket send failed: {self._send_error}"
+            ) from self._send_error
+        if self._writer is None or self._writer.done():
+            self._writer = asyncio.create_task(self._drain_loop())
+        await self._out_q.put(frame)
+
+    async def _drain_loop(self) -> None:
+        """Send queued frames in order, draining whatever is ready in one go"""
+        # Bound once: these are hit for every frame for the adapter's lifetime
+        queue = self._out_q
+        send = self.websocket_send
+        while True:
+            frames = [await queue.get()]
+            while len(frames) < WRITER_BATCH and not queue.empty():
+                frames.append(queue.get_nowait())
+            try:
+                for frame in frames:
+                    await send(frame)
+            except Exception as e:
+                logger.error("Error sending from OrphiqAdapter writer: {}", e)
+                self._send_error = e
+                # Later frames can't be delivered either; release flush() waiters
+                while not queue.empty():
+                    queue.get_nowait()
+                    queue.task_done()
+                return
+            finally:
+                for _ in frames:
+                    queue.task_done()
+
+    async def flush(self) -> None:
+        """Wait until every queued frame has been handed to the WebSocket"""
+        await self._out_q.join()
+
+    async def close(self) -> None:
+        """Stop the writer task, discarding unsent frames"""
+        if self._writer is not None:
+            self._writer.cancel()
+            self._writer = None
+
+    def _expression_frame(self, expression_id: int) -> bytes:
+        """Return the encoded expression payload, reusing it per character"""
+        # A character switch replaces character_config, selecting another cache
+        character_config = self.context.character_config
+        if character_config is not self._expr_owner:
+            self._expr_frames = _expr_frames_for(character_config)
+            self._expr_owner = character_config
+        key = (type(expression_id), expression_id)
+        frame = self._expr_frames.get(key)
+        if frame is None:
+            # Sent as an audio payload without audio
+            frame = self._expr_frames[key] = orjson.dumps(
+                {
+                    **_EXPR_TEMPLATE,
+                    "display_text": {
+                        "text": f"Expression {expression_id}",
+                        "name": character_config.character_name,
+                        "avatar": character_config.avatar,
+                    },
+                    "actions": _actions_for_expr(expression_id),
+                }
+            )
+        return frame
 
     async def generate_text(
         self,
@@ -43,7 +245,9 @@ class OrphiqAdapter(BackendAdapter):
             context: Optional context dictionary (not used in orphiq mode)
 
         Yields:
-            str: Text chunks as they are generated
+            str: Text chunks as they are generated, coalesced up to sentence
+                boundaries, BATCH_BYTES or BATCH_MS, together with any text
+                already waiting when a batch is yielded
         """
         try:
             # Create batch input using existing utility
@@ -56,17 +260,91 @@ class OrphiqAdapter(BackendAdapter):
             # Use existing agent engine
             agent_output = self.context.agent_engine.chat(batch_input)
 
-            # Process output and yield text
-            async for output in agent_output:
-                if isinstance(output, SentenceOutput):
-                    yield output.display_text.text
-                elif isinstance(output, AudioOutput):
-                    yield output.transcript
-                else:
-                    logger.warning(f"Unknown output type: {type(output)}")
+            # Read the agent stream in a separate task so the next chunk is
+            # produced while the current batch is being yielded
+            queue: asyncio.Queue = asyncio.Queue(maxsize=PIPELINE_DEPTH)
+            stopped = False
 
-        except Exception as e:
-            logger.error(f"Error generating text in OrphiqAdapter: {e}")
+            async def produce() -> None:
+                try:
+                    async for output in agent_output:
+                        text = _extract_text(output)
+                        if text:
+                            await queue.put(text)
+                except Exception as e:
+                    await queue.put(e)
+                    return
+                except BaseException as e:
+                    # Cancellation from the agent side must reach the reader
+                    # too, or it waits on the queue forever. Not when the
+                    # reader itself stopped us: nobody is left to read it.
+                    if not stopped:
+                        await queue.put(e)
+                    raise
+                await queue.put(_END)
+
+            producer = asyncio.create_task(produce())
+            try:
+                # Yield text, batching small chunks into one yield
+                buf: list[str] = []
+                buf_bytes = 0
+                deadline = 0.0
+                while True:
+                    if not queue.empty() or not buf:
+                        item = await queue.get()
+                    else:
+                        # Flush a pending batch at its deadline even if the
+                        # agent goes quiet
+                        try:
+                            item = await asyncio.wait_for(
+                                queue.get(), max(0.0, deadline - time.monotonic())
+                            )
+                        except asyncio.TimeoutError:
+                            yield "".join(buf)
+                            buf.clear()
+                            buf_bytes = 0
+                            continue
+
+                    if item is _END:
+                        break
+                    if isinstance(item, BaseException):
+                        raise item
+
+                    if not buf:
+                        deadline = time.monotonic() + BATCH_MS / 1000
+                    buf.append(item)
+                    buf_bytes += len(item)
+
+                    if (
+                        item.rstrip(" ").endswith(_SENTENCE_ENDINGS)
+                        or buf_bytes >= BATCH_BYTES
+                        or time.monotonic() >= deadline
+                    ):
+                        # Text that queued up while the last batch was being
+                        # sent goes out with this one (at most PIPELINE_DEPTH
+                        # chunks)
+                        item = None
+                        while not queue.empty():
+                            item = queue.get_nowait()
+                            if not isinstance(item, str):
+                                break
+                            buf.append(item)
+                        yield "".join(buf)
+                        buf.clear()
+                        buf_bytes = 0
+                        if item is _END:
+                            break
+                        if isinstance(item, BaseException):
+                            raise item
+
+                if buf:
+                    yield "".join(buf)
+            finally:
+                stopped = True
+                producer.cancel()
+
+        except Exception:
+            logger.exception("Error generating text in OrphiqAdapter")
             raise
 
     async def trigger_expression(
@@ -85,30 +363,14 @@ class OrphiqAdapter(BackendAdapter):
 
         Returns:
             dict: Result dictionary
+
+        Raises:
+            AdapterError: If the command could not be queued, or an earlier
+                command failed to send
         """
         try:
-            # Create actions payload
-            from ..agent.output_types import Actions
-
-            actions = Actions(expressions=[expression_id])
-
-            # Send via WebSocket as audio payload (without audio)
-            payload = {
-                "type": "audio",
-                "audio": None,
-                "volumes": [],
-                "slice_length": 20,
-                "display_text": {
-                    "text": f"Expression {expression_id}",
-                    "name": self.context.character_config.character_name,
-                    "avatar": self.context.character_config.avatar,
-                },
-                "actions": actions.to_dict(),
-                "forwarded": False,
-            }
-
             # Send via websocket
-            await self.websocket_send(json.dumps(payload))
+            await self._enqueue(self._expression_frame(expression_id))
 
             self._current_expression = expression_id
 
@@ -120,11 +382,7 @@ class OrphiqAdapter(BackendAdapter):
             }
 
         except Exception as e:
-            logger.error(f"Error triggering expression: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-            }
+            raise AdapterError(f"Error triggering expression: {e}") from e
 
     async def trigger_motion(
         self,
@@ -144,19 +402,17 @@ class OrphiqAdapter(BackendAdapter):
 
         Returns:
             dict: Result dictionary
+
+        Raises:
+            AdapterError: If the command could not be queued, or an earlier
+                command failed to send
         """
         try:
             # For now, we'll send a message indicating motion request
             # Full motion integration requires Live2D model API access
-            payload = {
-                "type": "motion-command",
-                "motion_group": motion_group,
-                "motion_index": motion_index,
-                "loop": loop,
-                "priority": priority,
-            }
-
-            await self.websocket_send(json.dumps(payload))
+            await self._enqueue(
+                _motion_frame(motion_group, motion_index, loop, priority)
+            )
 
             self._current_motion = {
                 "group": motion_group,
@@ -173,11 +429,7 @@ class OrphiqAdapter(BackendAdapter):
             }
 
         except Exception as e:
-            logger.error(f"Error triggering motion: {e}")
-            return {
-                "status": "error",
-                "error": str(e),
-            }
+            raise AdapterError(f"Error triggering motion: {e}") from e
 
     async def get_character_state(self) -> Dict[str, Any]:
         """
@@ -186,11 +438,20 @@ class OrphiqAdapter(BackendAdapter):
         Returns:
             dict: Current character state
         """
+        # Character and model switches replace these objects, so rebuild on change
+        character_config = self.context.character_config
+        live2d_model = self.context.live2d_model
+        owner = self._static_owner
+        if not owner or owner[0] is not character_config or owner[1] is not live2d_model:
+            self._static_owner = (character_config, live2d_model)
+            self._static_state = {
+                "character_name": character_config.character_name,
+                "model_name": live2d_model.live2d_model_name,
+                "config_uid": character_config.conf_uid,
+            }
         return {
-            "character_name": self.context.character_config.character_name,
-            "model_name": self.context.live2d_model.live2d_model_name,
+            **self._static_state,
             "current_expression": self._current_expression,
             "current_motion": self._current_motion,
-            "config_uid": self.context.character_config.conf_uid,
         }
 
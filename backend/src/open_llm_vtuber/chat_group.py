@@ -1,10 +1,18 @@
-from typing import Dict, List, Optional, Set, Tuple, Callable, Any
+from typing import Dict, List, Optional, Set, Tuple, Callable, Any, Awaitable
 from dataclasses import dataclass
 from fastapi import WebSocket
+import asyncio
 import json
+import orjson
 from loguru import logger
 
 
+# Seconds a send to a client may stay blocked before the client is dropped
+# with WS_POLICY_VIOLATION, so a stalled reader can't hold a writer forever
+WS_SEND_TIMEOUT = 10.0
+WS_POLICY_VIOLATION = 1008
+
+
 @dataclass
 class Group:
     group_id: str
@@ -284,6 +292,26 @@ async def handle_client_disconnect(
             )
 
 
+async def send_or_close(
+    websocket: WebSocket, client_uid: str, send: Awaitable[None]
+) -> None:
+    """
+    Await a send on `websocket`, closing the connection with
+    WS_POLICY_VIOLATION if it stays blocked for WS_SEND_TIMEOUT seconds
+
+    Raises:
+        asyncio.TimeoutError: If the send timed out
+    """
+    try:
+        await asyncio.wait_for(send, WS_SEND_TIMEOUT)
+    except asyncio.TimeoutError:
+        logger.warning(
+            f"Closing client {client_uid}: send blocked for over {WS_SEND_TIMEOUT}s"
+        )
+        await websocket.close(code=WS_POLICY_VIOLATION, reason="Client too slow")
+        raise
+
+
 async def broadcast_to_group(
     group_members: List[str],
     message: Dict[str, Any],
@@ -291,9 +319,27 @@ async def broadcast_to_group(
     exclude_uid: Optional[str] = None,
 ) -> None:
     """Broadcasts a message to all members in a group except the sender"""
-    for member_uid in group_members:
-        if member_uid != exclude_uid and member_uid in client_connections:
-            try:
-                await client_connections[member_uid].send_text(json.dumps(message))
-            except Exception as e:
-                logger.error(f"Failed to broadcast to {member_uid}: {e}")
+    recipients = [
+        member_uid
+        for member_uid in group_members
+        if member_uid != exclude_uid and member_uid in client_connections
+    ]
+    if not recipients:
+        return
+
+    # Encoded once for every recipient; one slow member doesn't hold up the rest
+    text = orjson.dumps(message, option=orjson.OPT_NON_STR_KEYS).decode()
+    results = await asyncio.gather(
+        *(
+            send_or_close(
+                client_connections[member_uid],
+                member_uid,
+                client_connections[member_uid].send_text(text),
+            )
+            for member_uid in recipients
+        ),
+        return_exceptions=True,
+    )
+    for member_uid, result in zip(recipients, results):
+        if isinstance(result, Exception):
+            logger.error(f"Failed to broadcast to {member_uid}: {result}")
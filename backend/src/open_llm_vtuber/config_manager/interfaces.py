@@ -1,33 +1,53 @@
+from functools import cached_property, lru_cache
 from pydantic import BaseModel, ConfigDict
 from pathlib import Path
 from typing import Dict
 
+
+@lru_cache(maxsize=None)
+def _cached_property_names(cls) -> tuple[str, ...]:
+    """Names of cached properties on a model class, excluding shadowing fields"""
+    return tuple(
+        name
+        for klass in cls.__mro__
+        for name, attr in vars(klass).items()
+        if isinstance(attr, cached_property) and name not in cls.model_fields
+    )
+
+
 class ServerPaths(BaseModel):
     """Base class defining required paths for the WebSocketServer"""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
     
     live2d_models_dir: str | Path
     shared_assets_dir: str | Path
     cache_dir: str | Path
 
-    @property
+    def model_copy(self, *, update=None, deep: bool = False):
+        copied = super().model_copy(update=update, deep=deep)
+        # Derived paths are cached; the copy may have different base directories
+        for cached in _cached_property_names(type(self)):
+            copied.__dict__.pop(cached, None)
+        return copied
+
+    @cached_property
     def backgrounds_dir(self) -> Path:
         """Returns path to backgrounds directory"""
         return Path(self.shared_assets_dir) / "backgrounds"
     
-    @property
+    @cached_property
     def avatars_dir(self) -> Path:
         """Returns path to avatars directory"""
         return Path(self.shared_assets_dir) / "avatars"
     
-    @property 
+    @cached_property
     def assets_dir(self) -> Path:
         """Returns path to assets directory"""
         return Path(self.shared_assets_dir) / "assets"
 
 class ServerConfig(BaseModel):
     """Configuration required by the WebSocketServer"""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(arbitrary_types_allowed=True, frozen=True)
     
     host: str
     port: int
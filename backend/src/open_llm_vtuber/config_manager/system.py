@@ -1,60 +1,54 @@
 # config_manager/system.py
+from functools import cached_property
 from pydantic import Field, model_validator, ConfigDict
-from typing import Dict, ClassVar
+from types import MappingProxyType
+from typing import Dict, ClassVar, Mapping
 from pathlib import Path
 from .i18n import I18nMixin, Description
 from .interfaces import ServerPaths
 
 
+# (field, English, Chinese); built once into a read-only mapping below
+_SYSTEM_DESCRIPTIONS_RAW = (
+    ("conf_version", "Configuration version", "配置文件版本"),
+    ("host", "Server host address", "服务器主机地址"),
+    ("port", "Server port number", "服务器端口号"),
+    ("config_alts_dir", "Directory for alternative configurations", "备用配置目录"),
+    (
+        "tool_prompts",
+        "Tool prompts to be inserted into persona prompt",
+        "要插入到角色提示词中的工具提示词",
+    ),
+    ("live2d_models_dir", "Directory containing Live2D models", "Live2D模型目录"),
+    ("shared_assets_dir", "Directory containing shared assets", "共享资源目录"),
+    ("cache_dir", "Directory for cached files", "缓存文件目录"),
+    ("backgrounds_dir", "Directory containing background images", "背景图像目录"),
+    ("characters_dir", "Directory containing character configurations", "角色配置目录"),
+)
+
+
 class SystemConfig(I18nMixin, ServerPaths):
     """System configuration settings."""
-    model_config = ConfigDict(arbitrary_types_allowed=True)
+    model_config = ConfigDict(
+        arbitrary_types_allowed=True, populate_by_name=True, frozen=True
+    )
 
-    conf_version: str = Field(..., alias="conf_version")
-    host: str = Field(..., alias="host")
-    port: int = Field(..., alias="port")
-    config_alts_dir: str = Field(..., alias="config_alts_dir")
-    tool_prompts: Dict[str, str] = Field(..., alias="tool_prompts")
+    conf_version: str = Field(...)
+    host: str = Field(...)
+    port: int = Field(...)
+    config_alts_dir: str = Field(...)
+    tool_prompts: Dict[str, str] = Field(...)
     
     # Base paths
-    live2d_models_dir: str = Field(default="config/live2d-models", alias="live2d_models_dir")
-    shared_assets_dir: str = Field(default="config/shared", alias="shared_assets_dir")
-    cache_dir: str = Field(default="cache", alias="cache_dir")
-    backgrounds_dir: str = Field(default="config/shared/backgrounds", alias="backgrounds_dir")
-    characters_dir: str = Field(default="config/characters", alias="characters_dir")
+    live2d_models_dir: str = Field(default="config/live2d-models")
+    shared_assets_dir: str = Field(default="config/shared")
+    cache_dir: str = Field(default="cache")
+    backgrounds_dir: str = Field(default="config/shared/backgrounds")
+    characters_dir: str = Field(default="config/characters")
 
-    DESCRIPTIONS: ClassVar[Dict[str, Description]] = {
-        "conf_version": Description(en="Configuration version", zh="配置文件版本"),
-        "host": Description(en="Server host address", zh="服务器主机地址"),
-        "port": Description(en="Server port number", zh="服务器端口号"),
-        "config_alts_dir": Description(
-            en="Directory for alternative configurations", zh="备用配置目录"
-        ),
-        "tool_prompts": Description(
-            en="Tool prompts to be inserted into persona prompt",
-            zh="要插入到角色提示词中的工具提示词",
-        ),
-        "live2d_models_dir": Description(
-            en="Directory containing Live2D models", 
-            zh="Live2D模型目录"
-        ),
-        "shared_assets_dir": Description(
-            en="Directory containing shared assets", 
-            zh="共享资源目录"
-        ),
-        "cache_dir": Description(
-            en="Directory for cached files",
-            zh="缓存文件目录"
-        ),
-        "backgrounds_dir": Description(
-            en="Directory containing background images",
-            zh="背景图像目录"
-        ),
-        "characters_dir": Description(
-            en="Directory containing character configurations",
-            zh="角色配置目录"
-        ),
-    }
+    DESCRIPTIONS: ClassVar[Mapping[str, Description]] = MappingProxyType(
+        {key: Description(en=en, zh=zh) for key, en, zh in _SYSTEM_DESCRIPTIONS_RAW}
+    )
 
     @model_validator(mode="after")
     def check_port(cls, values):
@@ -65,39 +59,33 @@ class SystemConfig(I18nMixin, ServerPaths):
 
     def get_backgrounds_path(self) -> Path:
         """Returns path to backgrounds directory"""
-        return Path(self.backgrounds_dir)
+        return self.backgrounds_path
     
     def get_characters_path(self) -> Path:
         """Returns path to character configs directory"""
-        return Path(self.characters_dir)
+        return self.characters_path
 
-    @property
+    @cached_property
     def avatars_dir(self) -> Path:
         """Returns path to avatars directory"""
         return Path(self.shared_assets_dir) / "avatars"
     
-    @property 
+    @cached_property
     def assets_dir(self) -> Path:
         """Returns path to assets directory"""
         return Path(self.shared_assets_dir) / "assets"
 
-    @property
+    @cached_property
     def live2d_models_path(self) -> Path:
         """Returns absolute path to live2d models directory"""
         return Path(self.live2d_models_dir).resolve()
 
-    @property 
-    def model_paths(self) -> Dict[str, Path]:
-        """Returns mapping of model names to their paths"""
-        paths = {}
-        for model_dir in self.live2d_models_path.iterdir():
-            if model_dir.is_dir():
-                model_json = list(model_dir.glob("*.model.json"))
-                if model_json:
-                    paths[model_dir.name] = model_json[0]
-        return paths
-
-    @property
+    @cached_property
     def backgrounds_path(self) -> Path:
         """Returns path to backgrounds directory"""
         return Path(self.backgrounds_dir)
+
+    @cached_property
+    def characters_path(self) -> Path:
+        """Returns path to character configs directory"""
+        return Path(self.characters_dir)
@@ -6,6 +6,7 @@ from typing import Union, Dict, Any, TypeVar
 from pydantic import BaseModel, ValidationError
 import os
 import re
+import threading
 import chardet
 from loguru import logger
 
@@ -13,6 +14,10 @@ from .main import Config
 
 T = TypeVar("T", bound=BaseModel)
 
+# The shared YAML instance keeps parser state, so loads from worker threads
+# are serialized
+_yaml_lock = threading.Lock()
+
 
 def read_yaml(config_path: str) -> Dict[str, Any]:
     """
@@ -47,7 +52,8 @@ def read_yaml(config_path: str) -> Dict[str, Any]:
     content = pattern.sub(replacer, content)
 
     try:
-        return yaml.load(content)
+        with _yaml_lock:
+            return yaml.load(content)
     except Exception as e:
         logger.critical(f"Error parsing YAML file: {e}")
         raise e
@@ -1,6 +1,6 @@
 import asyncio
 import json
-from typing import Dict, Optional, Callable
+from typing import Dict, List, Optional, Callable
 
 import numpy as np
 from fastapi import WebSocket
@@ -15,6 +15,17 @@ from .conversation_utils import EMOJI_LIST
 from .types import GroupConversationState
 
 
+def _drain_audio_buffer(
+    received_data_buffers: Dict[str, Optional[List[np.ndarray]]], client_uid: str
+) -> np.ndarray:
+    """Join a client's buffered audio chunks into one float32 array and reset it"""
+    parts = received_data_buffers[client_uid]
+    received_data_buffers[client_uid] = None
+    if not parts:
+        return np.empty(0, dtype=np.float32)
+    return np.concatenate(parts).astype(np.float32, copy=False)
+
+
 async def handle_conversation_trigger(
     msg_type: str,
     data: dict,
@@ -24,7 +35,7 @@ async def handle_conversation_trigger(
     client_contexts: Dict[str, ServiceContext],
     client_connections: Dict[str, WebSocket],
     chat_group_manager: ChatGroupManager,
-    received_data_buffers: Dict[str, np.ndarray],
+    received_data_buffers: Dict[str, Optional[List[np.ndarray]]],
     current_conversation_tasks: Dict[str, Optional[asyncio.Task]],
     broadcast_to_group: Callable,
 ) -> None:
@@ -42,8 +53,7 @@ async def handle_conversation_trigger(
     elif msg_type == "text-input":
         user_input = data.get("text", "")
     else:  # mic-audio-end
-        user_input = received_data_buffers[client_uid]
-        received_data_buffers[client_uid] = np.array([])
+        user_input = _drain_audio_buffer(received_data_buffers, client_uid)
 
     images = data.get("images")
     session_emoji = np.random.choice(EMOJI_LIST)
@@ -1,8 +1,15 @@
-import json
+import asyncio
+import hashlib
+import re
+import struct
+import time
+from collections import deque
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import uuid4
 import numpy as np
+import orjson
 from datetime import datetime
-from fastapi import APIRouter, WebSocket, UploadFile, File, Response
+from fastapi import APIRouter, WebSocket, UploadFile, File, Request, Response
 from starlette.websockets import WebSocketDisconnect
 from loguru import logger
 from .service_context import ServiceContext
@@ -10,6 +17,373 @@ from .websocket_handler import WebSocketHandler
 from pathlib import Path
 import os
 from .config_manager.utils import read_yaml
+from .utils.sentence_divider import ABBREVIATIONS
+
+# Maps int16 PCM samples onto [-1.0, 1.0)
+PCM16_SCALE = np.float32(1.0 / 32768.0)
+# Bytes read from an audio upload at a time
+WAV_READ_CHUNK = 65536
+# WAV fmt chunk format tags, and the most channels /asr will downmix
+WAVE_FORMAT_PCM = 0x0001
+WAVE_FORMAT_EXTENSIBLE = 0xFFFE
+WAV_MAX_CHANNELS = 8
+
+# Reusable /asr sample buffers: up to PCM_POOL_SIZE idle buffers of
+# PCM_POOL_SAMPLES (60s at 16kHz) float32 samples each
+PCM_POOL_SIZE = 4
+PCM_POOL_SAMPLES = 60 * 16000
+_PCM_POOL: deque = deque()
+
+# Concurrent /client-ws and /tts-ws sessions, overridable via WS_MAX / TTS_WS_MAX
+WS_MAX_DEFAULT = "256"
+TTS_WS_MAX_DEFAULT = "64"
+# Close code sent to connections over the limit
+WS_TRY_AGAIN_LATER = 1013
+# Sentences synthesized at once by /tts-ws
+TTS_CONCURRENCY = 4
+# Sentence breaks for /tts-ws: whitespace after . ! ? (so decimals, URLs and
+# "e.g.x" stay whole), or directly after full-width CJK end punctuation
+_SENTENCE_BREAK = re.compile(r"(?<=[.!?])\s+|(?<=[。！？])\s*")
+_ABBREVIATIONS = tuple(ABBREVIATIONS)
+# Titles that precede a name and never end a sentence
+_TITLES = ("Mr.", "Mrs.", "Prof.")
+
+
+def _continues_abbreviation(previous: str, piece: str) -> bool:
+    """
+    Whether `piece` continues the sentence that `previous` ends with an
+    abbreviation. Most abbreviations ("St.", "Rd.", "Inc.") can also end a
+    sentence, so they only continue into lowercase or numeric text.
+    """
+    if previous.endswith(_TITLES):
+        return True
+    return previous.endswith(_ABBREVIATIONS) and (
+        piece[0].islower() or piece[0].isdigit()
+    )
+
+
+def _split_sentences(text: str) -> List[str]:
+    """Split text into sentences for TTS, keeping their own punctuation"""
+    sentences: List[str] = []
+    for piece in _SENTENCE_BREAK.split(text.strip()):
+        if not piece:
+            continue
+        # "e.g. apples" splits after the abbreviation; glue it back on
+        if sentences and _continues_abbreviation(sentences[-1], piece):
+            sentences[-1] = f"{sentences[-1]} {piece}"
+        else:
+            sentences.append(piece)
+    return sentences
+
+# Parsed character YAML per file, reused while the file's (mtime_ns, size) holds
+_CHAR_CACHE: Dict[Path, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+# Character id (conf_uid or file stem) -> YAML file per directory, keyed on a
+# signature of the files it was built from
+_CHAR_INDEX: Dict[Path, Tuple[Tuple, Dict[str, Path]]] = {}
+# Models listed in model_dict.json, reused while the file's mtime holds
+_MODELS_CACHE: Dict[Path, Tuple[int, List[Dict[str, Any]]]] = {}
+# Character YAML files per directory, reused while the directory's mtime holds
+_CHAR_FILES: Dict[Path, Tuple[int, List[Path]]] = {}
+# Background image entries per directory, reused while the directory's mtime holds
+_BACKGROUNDS: Dict[Path, Tuple[int, List[Dict[str, str]]]] = {}
+BACKGROUND_EXTENSIONS = frozenset({"jpg", "jpeg", "png", "gif", "webp"})
+
+
+def _etag_response(request: Request, payload: Any) -> Response:
+    """
+    Serialize a JSON payload with an ETag, answering 304 when the client's
+    If-None-Match already names it.
+    """
+    body = orjson.dumps(payload)
+    etag = f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": "private, must-revalidate"}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and (
+        if_none_match.strip() == "*"
+        or etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    ):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+async def _send_json(websocket: WebSocket, payload: Dict[str, Any]) -> None:
+    """Send a JSON text frame, encoded with orjson"""
+    await websocket.send_text(orjson.dumps(payload).decode())
+
+
+def _load_models(model_dict_path: Path) -> List[Dict[str, Any]]:
+    """Read the model list from model_dict.json, re-parsing only when it changes"""
+    mtime = model_dict_path.stat().st_mtime_ns
+    entry = _MODELS_CACHE.get(model_dict_path)
+    if entry is None or entry[0] != mtime:
+        model_data = orjson.loads(model_dict_path.read_bytes())
+        entry = _MODELS_CACHE[model_dict_path] = (
+            mtime,
+            [
+                {
+                    "name": model["name"],
+                    "description": model.get("description", ""),
+                    "url": model["url"],
+                }
+                for model in model_data
+            ],
+        )
+    return entry[1]
+
+
+def _char_files(characters_dir: Path) -> List[Path]:
+    """List the character YAML files in a directory, cached on its mtime"""
+    try:
+        mtime = characters_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    entry = _CHAR_FILES.get(characters_dir)
+    if entry is None or entry[0] != mtime:
+        entry = _CHAR_FILES[characters_dir] = (
+            mtime,
+            list(characters_dir.glob("*.yaml")),
+        )
+    return entry[1]
+
+
+def _scan_backgrounds(backgrounds_dir: Path) -> List[Dict[str, str]]:
+    """Build the entries for the visible image files in a directory"""
+    backgrounds = []
+    with os.scandir(backgrounds_dir) as entries:
+        for entry in entries:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            stem, dot, ext = name.rpartition(".")
+            if not dot or ext.lower() not in BACKGROUND_EXTENSIONS:
+                continue
+            # scandir's dirent type saves a stat for regular files
+            if entry.is_file():
+                # Paths map to the mounted /bg route
+                backgrounds.append({"name": stem, "path": f"/bg/{name}"})
+    return backgrounds
+
+
+def _list_backgrounds(backgrounds_dir: Path) -> List[Dict[str, str]]:
+    """List the background images in a directory, cached on its mtime"""
+    try:
+        mtime = backgrounds_dir.stat().st_mtime_ns
+    except FileNotFoundError:
+        return []
+    entry = _BACKGROUNDS.get(backgrounds_dir)
+    if entry is None or entry[0] != mtime:
+        entry = _BACKGROUNDS[backgrounds_dir] = (
+            mtime,
+            _scan_backgrounds(backgrounds_dir),
+        )
+    return entry[1]
+
+
+def _cached_char(char_file: Path) -> Optional[Dict[str, Any]]:
+    """Parsed character YAML if the cached copy is still current, else None"""
+    entry = _CHAR_CACHE.get(char_file)
+    if entry is not None:
+        st = char_file.stat()
+        if entry[0] == (st.st_mtime_ns, st.st_size):
+            return entry[1]
+    return None
+
+
+def _load_char(char_file: Path) -> Dict[str, Any]:
+    """Read a character YAML file, re-parsing only when it has changed"""
+    st = char_file.stat()
+    key = (st.st_mtime_ns, st.st_size)
+    entry = _CHAR_CACHE.get(char_file)
+    if entry is None or entry[0] != key:
+        entry = _CHAR_CACHE[char_file] = (key, read_yaml(char_file))
+    return entry[1]
+
+
+async def _char_index(characters_dir: Path) -> Dict[str, Path]:
+    """
+    Map character ids to their YAML files: each file's stem, overridden by
+    conf_uid (the first file wins on duplicates). Rebuilt only when the set
+    of files or any file's contents change.
+    """
+    char_files = _char_files(characters_dir)
+    char_configs = await _load_chars(char_files)
+    # _load_chars refreshed the cache, so its stat keys describe these files
+    signature = tuple(
+        (char_file, _CHAR_CACHE[char_file][0] if char_file in _CHAR_CACHE else None)
+        for char_file in char_files
+    )
+    entry = _CHAR_INDEX.get(characters_dir)
+    if entry is not None and entry[0] == signature:
+        return entry[1]
+
+    by_uid: Dict[str, Path] = {}
+    for char_file, char_config in zip(char_files, char_configs):
+        if isinstance(char_config, Exception):
+            logger.error(f"Error reading character file {char_file}: {char_config}")
+            continue
+        conf_uid = (char_config.get("character_config") or {}).get("conf_uid")
+        if conf_uid is not None:
+            by_uid.setdefault(conf_uid, char_file)
+    index = {**{char_file.stem: char_file for char_file in char_files}, **by_uid}
+    _CHAR_INDEX[characters_dir] = (signature, index)
+    return index
+
+
+async def _load_chars(char_files: List[Path]) -> List[Dict[str, Any] | Exception]:
+    """
+    Load character YAML files, parsing the changed ones in a worker thread.
+    A file that fails to load yields its exception in its slot.
+    """
+    results: List[Dict[str, Any] | Exception | None] = []
+    for char_file in char_files:
+        try:
+            results.append(_cached_char(char_file))
+        except Exception as e:
+            results.append(e)
+
+    stale = [i for i, result in enumerate(results) if result is None]
+    if stale:
+        # One thread for all of them: read_yaml shares a module-level ruamel
+        # YAML instance, which is not safe to use from several threads at once
+        def parse_stale() -> None:
+            for i in stale:
+                try:
+                    results[i] = _load_char(char_files[i])
+                except Exception as e:
+                    results[i] = e
+
+        await asyncio.to_thread(parse_stale)
+    return results
+
+
+def _parse_wav_fmt(fmt: bytes, sample_rate: Optional[int]) -> int:
+    """
+    Check a WAV `fmt ` chunk describes 16-bit integer PCM at the expected
+    sample rate, returning its channel count.
+    """
+    if len(fmt) < 16:
+        raise ValueError("Invalid WAV file: Truncated fmt chunk")
+    format_tag, channels, rate, _, _, bits = struct.unpack_from("<HHIIHH", fmt)
+    if format_tag == WAVE_FORMAT_EXTENSIBLE and len(fmt) >= 26:
+        # The real format is the first two bytes of the SubFormat GUID
+        format_tag = int.from_bytes(fmt[24:26], "little")
+    if format_tag != WAVE_FORMAT_PCM or bits != 16:
+        raise ValueError(
+            f"Unsupported WAV format: expected 16-bit PCM, got format {format_tag} "
+            f"with {bits} bits per sample"
+        )
+    if not 1 <= channels <= WAV_MAX_CHANNELS:
+        raise ValueError(f"Unsupported WAV format: {channels} channels")
+    if sample_rate is not None and rate != sample_rate:
+        raise ValueError(
+            f"Unsupported WAV format: expected {sample_rate} Hz, got {rate} Hz"
+        )
+    return channels
+
+
+async def _read_pcm16_wav(
+    file: UploadFile,
+    buffer: Optional[np.ndarray] = None,
+    sample_rate: Optional[int] = None,
+) -> np.ndarray:
+    """
+    Read the data chunk of a 16-bit PCM WAV upload as mono float32 samples.
+
+    The upload is read in WAV_READ_CHUNK pieces and converted straight into a
+    preallocated array, so the raw bytes are never held in memory whole.
+    The `fmt ` chunk is validated (16-bit PCM, at `sample_rate` if given) and
+    multi-channel audio is downmixed; other chunks (LIST, bext, ...) are
+    skipped. Input without a RIFF/WAVE header is treated as a standard
+    44-byte header plus mono PCM data. If `buffer` is large enough for the
+    declared data it is filled instead, and the result is a view into it.
+    """
+    header = await file.read(12)
+    if len(header) < 12:
+        raise ValueError("Invalid WAV file: File too small")
+
+    channels = 1
+    data_size = None
+    if header[:4] == b"RIFF" and header[8:12] == b"WAVE":
+        while True:
+            chunk_header = await file.read(8)
+            if len(chunk_header) < 8:
+                raise ValueError("Invalid WAV file: No data chunk")
+            chunk_id, chunk_size = struct.unpack("<4sI", chunk_header)
+            if chunk_id == b"data":
+                # Streaming writers leave the size unset; read to the end then
+                if chunk_size not in (0, 0xFFFFFFFF):
+                    data_size = chunk_size
+                break
+            # Chunks are padded to an even length
+            skip = chunk_size + (chunk_size & 1)
+            body = await file.read(skip)
+            if len(body) < skip:
+                raise ValueError("Invalid WAV file: No data chunk")
+            if chunk_id == b"fmt ":
+                channels = _parse_wav_fmt(body[:chunk_size], sample_rate)
+    elif len(await file.read(32)) < 32:
+        raise ValueError("Invalid WAV file: File too small")
+
+    # Bytes per sample frame (one 16-bit sample per channel)
+    frame_size = 2 * channels
+    if data_size is not None:
+        if data_size % frame_size != 0:
+            raise ValueError(
+                f"Invalid audio data: Buffer size must be a multiple of {frame_size}"
+            )
+        n_frames = data_size // frame_size
+        if buffer is not None and len(buffer) >= n_frames:
+            out = buffer[:n_frames]
+        else:
+            out = np.empty(n_frames, dtype=np.float32)
+        pieces = None
+    else:
+        out = None
+        pieces = []
+
+    remaining = data_size
+    offset = 0
+    carry = b""
+    while remaining is None or remaining > 0:
+        size = WAV_READ_CHUNK if remaining is None else min(WAV_READ_CHUNK, remaining)
+        chunk = await file.read(size)
+        if not chunk:
+            break
+        if remaining is not None:
+            remaining -= len(chunk)
+        if carry:
+            chunk = carry + chunk
+            carry = b""
+        partial = len(chunk) % frame_size
+        if partial:
+            # Keep the partial frame for the next read so frames stay aligned
+            carry = chunk[-partial:]
+            chunk = chunk[:-partial]
+
+        samples = np.frombuffer(chunk, dtype=np.int16)
+        n = len(samples) // channels
+        dst = (
+            out[offset : offset + n]
+            if out is not None
+            else np.empty(n, dtype=np.float32)
+        )
+        if channels == 1:
+            np.multiply(samples, PCM16_SCALE, out=dst)
+        else:
+            samples.reshape(n, channels).mean(axis=1, dtype=np.float32, out=dst)
+            dst *= PCM16_SCALE
+        if pieces is not None:
+            pieces.append(dst)
+        offset += n
+
+    if carry:
+        raise ValueError(
+            f"Invalid audio data: Buffer size must be a multiple of {frame_size}"
+        )
+    if out is None:
+        return np.concatenate(pieces) if pieces else np.empty(0, dtype=np.float32)
+    # A truncated upload fills less than the declared data size
+    return out[:offset]
 
 
 def init_client_ws_route(default_context_cache: ServiceContext) -> APIRouter:
@@ -25,22 +399,28 @@ def init_client_ws_route(default_context_cache: ServiceContext) -> APIRouter:
 
     router = APIRouter()
     ws_handler = WebSocketHandler(default_context_cache)
+    sessions = asyncio.Semaphore(int(os.getenv("WS_MAX", WS_MAX_DEFAULT)))
 
     @router.websocket("/client-ws")
     async def websocket_endpoint(websocket: WebSocket):
         """WebSocket endpoint for client connections"""
         await websocket.accept()
+        if sessions.locked():
+            logger.warning("Rejecting client connection: session limit reached")
+            await websocket.close(code=WS_TRY_AGAIN_LATER, reason="Server busy")
+            return
         client_uid = str(uuid4())
 
-        try:
-            await ws_handler.handle_new_connection(websocket, client_uid)
-            await ws_handler.handle_websocket_communication(websocket, client_uid)
-        except WebSocketDisconnect:
-            await ws_handler.handle_disconnect(client_uid)
-        except Exception as e:
-            logger.error(f"Error in WebSocket connection: {e}")
-            await ws_handler.handle_disconnect(client_uid)
-            raise
+        async with sessions:
+            try:
+                await ws_handler.handle_new_connection(websocket, client_uid)
+                await ws_handler.handle_websocket_communication(websocket, client_uid)
+            except WebSocketDisconnect:
+                await ws_handler.handle_disconnect(client_uid)
+            except Exception as e:
+                logger.error(f"Error in WebSocket connection: {e}")
+                await ws_handler.handle_disconnect(client_uid)
+                raise
 
     return router
 
@@ -73,33 +453,17 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
         """
         Endpoint for transcribing audio using the ASR engine
         """
-        logger.info(f"Received audio file for transcription: {file.filename}")
+        logger.debug(f"Received audio file for transcription: {file.filename}")
 
+        buffer = (
+            _PCM_POOL.pop()
+            if _PCM_POOL
+            else np.empty(PCM_POOL_SAMPLES, dtype=np.float32)
+        )
         try:
-            contents = await file.read()
-
-            # Validate minimum file size
-            if len(contents) < 44:  # Minimum WAV header size
-                raise ValueError("Invalid WAV file: File too small")
-
-            # Decode the WAV header and get actual audio data
-            wav_header_size = 44  # Standard WAV header size
-            audio_data = contents[wav_header_size:]
-
-            # Validate audio data size
-            if len(audio_data) % 2 != 0:
-                raise ValueError("Invalid audio data: Buffer size must be even")
-
-            # Convert to 16-bit PCM samples to float32
-            try:
-                audio_array = (
-                    np.frombuffer(audio_data, dtype=np.int16).astype(np.float32)
-                    / 32768.0
-                )
-            except ValueError as e:
-                raise ValueError(
-                    f"Audio format error: {str(e)}. Please ensure the file is 16-bit PCM WAV format."
-                )
+            audio_array = await _read_pcm16_wav(
+                file, buffer, default_context_cache.asr_engine.SAMPLE_RATE
+            )
 
             # Validate audio data
             if len(audio_array) == 0:
@@ -111,111 +475,165 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
             logger.info(f"Transcription result: {text}")
             return {"text": text}
 
+        except asyncio.CancelledError:
+            # The ASR worker thread may still be reading the buffer
+            buffer = None
+            raise
+
         except ValueError as e:
             logger.error(f"Audio format error: {e}")
             return Response(
-                content=json.dumps({"error": str(e)}),
+                content=orjson.dumps({"error": str(e)}),
                 status_code=400,
                 media_type="application/json",
             )
         except Exception as e:
             logger.error(f"Error during transcription: {e}")
             return Response(
-                content=json.dumps(
+                content=orjson.dumps(
                     {"error": "Internal server error during transcription"}
                 ),
                 status_code=500,
                 media_type="application/json",
             )
+        finally:
+            if buffer is not None and len(_PCM_POOL) < PCM_POOL_SIZE:
+                _PCM_POOL.append(buffer)
+
+    # Caps concurrent TTS generations across all /tts-ws connections. Each
+    # connection handles one request at a time, so it holds at most one
+    # request's sentences.
+    tts_slots = asyncio.Semaphore(TTS_CONCURRENCY)
+    tts_sessions = asyncio.Semaphore(int(os.getenv("TTS_WS_MAX", TTS_WS_MAX_DEFAULT)))
+
+    async def synthesize(sentence: str, as_bytes: bool) -> str | bytes:
+        """Generate audio for a sentence, as a cache path or its bytes"""
+        async with tts_slots:
+            tts_engine = default_context_cache.tts_engine
+            file_name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid4())[:8]}"
+            audio_path = await tts_engine.async_generate_audio(
+                text=sentence, file_name_no_ext=file_name
+            )
+            if not as_bytes:
+                return audio_path
+            if not audio_path:
+                raise RuntimeError(f"TTS produced no audio for: {sentence}")
+            try:
+                return await asyncio.to_thread(Path(audio_path).read_bytes)
+            finally:
+                # The bytes go out over the socket, so the cache file isn't needed
+                tts_engine.remove_file(audio_path, verbose=False)
 
     @router.websocket("/tts-ws")
     async def tts_endpoint(websocket: WebSocket):
         """WebSocket endpoint for TTS generation"""
         await websocket.accept()
+        if tts_sessions.locked():
+            logger.warning("Rejecting TTS connection: session limit reached")
+            await websocket.close(code=WS_TRY_AGAIN_LATER, reason="Server busy")
+            return
         logger.info("TTS WebSocket connection established")
 
+        await tts_sessions.acquire()
         try:
             while True:
-                data = await websocket.receive_json()
+                data = orjson.loads(await websocket.receive_text())
                 text = data.get("text")
                 if not text:
                     continue
 
-                logger.info(f"Received text for TTS: {text}")
+                logger.debug(f"Received text for TTS: {text}")
 
-                # Split text into sentences
-                sentences = [s.strip() for s in text.split(".") if s.strip()]
+                sentences = _split_sentences(text)
+                # Streaming clients get each sentence's audio as a binary frame
+                # right before its partial, instead of a cache path to fetch
+                stream = bool(data.get("stream", False))
 
+                # Synthesize all sentences concurrently; results are sent in order
+                tasks = [
+                    asyncio.create_task(synthesize(sentence, stream))
+                    for sentence in sentences
+                ]
+                delivered = 0
                 try:
-                    # Generate and send audio for each sentence
-                    for sentence in sentences:
-                        sentence = sentence + "."  # Add back the period
-                        file_name = f"{datetime.now().strftime('%Y%m%d_%H%M%S')}_{str(uuid4())[:8]}"
-                        audio_path = (
-                            await default_context_cache.tts_engine.async_generate_audio(
-                                text=sentence, file_name_no_ext=file_name
+                    for sentence, task in zip(sentences, tasks):
+                        audio = await task
+                        if stream:
+                            logger.debug(
+                                f"Generated {len(audio)} bytes of audio for sentence: {sentence}"
                             )
-                        )
-                        logger.info(
-                            f"Generated audio for sentence: {sentence} at: {audio_path}"
+                            await websocket.send_bytes(audio)
+                            await _send_json(
+                                websocket,
+                                {"status": "partial", "text": sentence, "size": len(audio)},
+                            )
+                            delivered += 1
+                            continue
+
+                        logger.debug(
+                            f"Generated audio for sentence: {sentence} at: {audio}"
                         )
 
-                        await websocket.send_json(
+                        await _send_json(
+                            websocket,
                             {
                                 "status": "partial",
-                                "audioPath": audio_path,
+                                "audioPath": audio,
                                 "text": sentence,
-                            }
+                            },
                         )
+                        delivered += 1
 
                     # Send completion signal
-                    await websocket.send_json({"status": "complete"})
+                    await _send_json(websocket, {"status": "complete"})
 
                 except Exception as e:
                     logger.error(f"Error generating TTS: {e}")
-                    await websocket.send_json({"status": "error", "message": str(e)})
+                    await _send_json(websocket, {"status": "error", "message": str(e)})
+                finally:
+                    # Wait out the sentences never sent, so their errors are
+                    # retrieved, and drop the cache files the client won't fetch
+                    undelivered = tasks[delivered:]
+                    for task in undelivered:
+                        task.cancel()
+                    results = await asyncio.gather(*undelivered, return_exceptions=True)
+                    for audio in results:
+                        if isinstance(audio, str) and audio:
+                            default_context_cache.tts_engine.remove_file(
+                                audio, verbose=False
+                            )
 
         except WebSocketDisconnect:
             logger.info("TTS WebSocket client disconnected")
         except Exception as e:
             logger.error(f"Error in TTS WebSocket connection: {e}")
             await websocket.close()
+        finally:
+            tts_sessions.release()
 
     @router.get("/api/backgrounds")
-    async def get_backgrounds():
+    async def get_backgrounds(request: Request):
         """Get list of available background images"""
         try:
-            # Get backgrounds directory from system config
-            backgrounds_dir = default_context_cache.system_config.backgrounds_dir
-            
-            # List all files in the backgrounds directory
-            backgrounds = []
-            
-            # Use the existing mounted directory structure
-            for filename in default_context_cache.system_config.get_backgrounds_path().glob("*"):
-                # Check if file has valid image extension
-                if filename.suffix.lower() in ['.jpg', '.jpeg', '.png', '.gif']:
-                    backgrounds.append({
-                        "name": filename.stem,
-                        "path": f"/bg/{filename.name}"  # Maps to the mounted /bg route
-                    })
-            
-            logger.info(f"Found {len(backgrounds)} background images")
-            return backgrounds
+            backgrounds = _list_backgrounds(
+                default_context_cache.system_config.get_backgrounds_path()
+            )
+            logger.debug(f"Found {len(backgrounds)} background images")
+            return _etag_response(request, backgrounds)
 
         except Exception as e:
             logger.error(f"Error getting backgrounds: {e}")
             return []
 
     @router.get("/api/base-config")
-    async def get_base_config():
+    async def get_base_config(request: Request):
         """Get base configuration for Live2D viewer"""
         try:
             # Add debug info about current directory and paths
-            logger.info(f"Current working directory: {os.getcwd()}")
+            logger.debug(f"Current working directory: {os.getcwd()}")
             characters_dir = Path("config/characters")
-            logger.info(f"Characters directory exists: {characters_dir.exists()}")
-            logger.info(f"Characters directory absolute path: {characters_dir.absolute()}")
+            logger.debug(f"Characters directory exists: {characters_dir.exists()}")
+            logger.debug(f"Characters directory absolute path: {characters_dir.absolute()}")
             
             # Get TTS config
             tts_config = default_context_cache.character_config.tts_config
@@ -229,32 +647,30 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
                 "modelName": default_context_cache.character_config.live2d_model_name,
                 "persona": default_context_cache.character_config.persona_prompt
             }
-            logger.info(f"Current character: {current_character}")
+            logger.debug(f"Current character: {current_character}")
             
             # Load all available characters with enhanced logging
             characters = []
-            char_files = list(characters_dir.glob("*.yaml"))
-            logger.info(f"Found {len(char_files)} character files: {[f.name for f in char_files]}")
+            char_files = _char_files(characters_dir)
+            logger.opt(lazy=True).debug(
+                "Found {} character files: {}",
+                lambda: len(char_files),
+                lambda: [f.name for f in char_files],
+            )
             
-            for char_file in char_files:
+            load_start = time.perf_counter()
+            char_configs = await _load_chars(char_files)
+            for char_file, char_config in zip(char_files, char_configs):
                 try:
-                    logger.info(f"Loading character from: {char_file}")
-                    # Check file permissions
-                    logger.info(f"File {char_file} readable: {os.access(char_file, os.R_OK)}")
-                    
-                    # Read and log file content preview
-                    with open(char_file, 'r', encoding='utf-8') as f:
-                        content = f.read()
-                        logger.debug(f"File content preview: {content[:100]}...")
-                    
-                    char_config = read_yaml(char_file)
+                    if isinstance(char_config, Exception):
+                        raise char_config
                     
                     if "character_config" in char_config:
                         char_data = char_config["character_config"]
                         char_id = char_data.get("conf_uid", char_file.stem)
                         model_name = char_data.get("live2d_model_name", "shizuku-local")
                         
-                        logger.info(f"Adding character: {char_id} ({model_name})")
+                        logger.debug(f"Adding character: {char_id} ({model_name})")
                         characters.append({
                             "id": char_id,
                             "name": char_data.get("conf_name", char_file.stem),
@@ -264,9 +680,12 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
                     else:
                         logger.warning(f"No character_config section in {char_file}")
                 except Exception as e:
-                    logger.error(f"Error loading character {char_file}: {e}", exc_info=True)
+                    logger.warning(f"Error loading character {char_file}: {e}")
             
-            logger.info(f"Loaded {len(characters)} characters")
+            logger.info(
+                f"Loaded {len(characters)} characters in "
+                f"{(time.perf_counter() - load_start) * 1000:.1f}ms"
+            )
 
             # Build config object
             config = {
@@ -282,30 +701,19 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
 
             # Load model definitions
             try:
-                model_dict_path = Path("config/live2d-models/model_dict.json")
-                logger.info(f"Model dict exists: {model_dict_path.exists()}")
-                
-                with open(model_dict_path, "r", encoding="utf-8") as f:
-                    model_data = json.load(f)
-                    config["models"] = [
-                        {
-                            "name": model["name"],
-                            "description": model.get("description", ""),
-                            "url": model["url"]
-                        } for model in model_data
-                    ]
-                logger.info(f"Loaded {len(config['models'])} models")
+                config["models"] = _load_models(Path("config/live2d-models/model_dict.json"))
+                logger.debug(f"Loaded {len(config['models'])} models")
             except Exception as e:
-                logger.error(f"Error loading model_dict.json: {e}", exc_info=True)
+                logger.warning(f"Error loading model_dict.json: {e}")
                 config["models"] = []
 
-            logger.info(f"Returning base config with {len(characters)} characters and {len(config.get('models', []))} models")
-            return config
+            logger.debug(f"Returning base config with {len(characters)} characters and {len(config.get('models', []))} models")
+            return _etag_response(request, config)
 
         except Exception as e:
-            logger.error(f"Error loading base config: {e}", exc_info=True)
+            logger.exception(f"Error loading base config: {e}")
             return Response(
-                content=json.dumps({
+                content=orjson.dumps({
                     "error": str(e),
                     "models": [],
                     "characters": [],
@@ -324,46 +732,23 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
             
             # Find the character config file
             characters_dir = Path("config/characters")
-            character_file = None
-            
-            # First try exact match on conf_uid
-            logger.info("Searching for character by conf_uid...")
-            for char_file in characters_dir.glob("*.yaml"):
-                try:
-                    char_config = read_yaml(char_file)
-                    if "character_config" in char_config:
-                        conf_uid = char_config["character_config"].get("conf_uid")
-                        logger.debug(f"File {char_file.name} has conf_uid: {conf_uid}")
-                        if conf_uid == character_id:
-                            character_file = char_file
-                            logger.info(f"Found character by conf_uid in {char_file}")
-                            break
-                except Exception as e:
-                    logger.error(f"Error reading character file {char_file}: {e}")
-            
-            # If not found, try using the filename as fallback
-            if not character_file:
-                logger.info("Character not found by conf_uid, trying filename...")
-                for char_file in characters_dir.glob("*.yaml"):
-                    if char_file.stem == character_id:
-                        character_file = char_file
-                        logger.info(f"Found character by filename: {char_file}")
-                        break
+            # conf_uid matches take precedence over filename matches
+            character_file = (await _char_index(characters_dir)).get(character_id)
             
             if not character_file:
                 logger.warning(f"Character {character_id} not found in any files")
                 return Response(
-                    content=json.dumps({"error": f"Character {character_id} not found"}),
+                    content=orjson.dumps({"error": f"Character {character_id} not found"}),
                     status_code=404,
                     media_type="application/json"
                 )
             
             # Load the character config
-            logger.info(f"Loading character config from {character_file}")
+            logger.debug(f"Loading character config from {character_file}")
             
             # Validate the character file before loading
             try:
-                char_config = read_yaml(character_file)
+                char_config = _load_char(character_file)
                 if "character_config" not in char_config:
                     raise ValueError(f"Missing character_config section in {character_file}")
                     
@@ -372,11 +757,11 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
                 if missing_fields:
                     raise ValueError(f"Missing required fields in {character_file}: {missing_fields}")
                     
-                logger.info(f"Character file validated successfully: {character_file}")
+                logger.debug(f"Character file validated successfully: {character_file}")
             except Exception as e:
                 logger.error(f"Character file validation failed: {e}")
                 return Response(
-                    content=json.dumps({"error": f"Invalid character file: {str(e)}"}),
+                    content=orjson.dumps({"error": f"Invalid character file: {str(e)}"}),
                     status_code=400,
                     media_type="application/json"
                 )
@@ -400,9 +785,9 @@ def init_webtool_routes(default_context_cache: ServiceContext) -> APIRouter:
             }
         
         except Exception as e:
-            logger.error(f"Error switching character: {e}", exc_info=True)
+            logger.exception(f"Error switching character: {e}")
             return Response(
-                content=json.dumps({"error": str(e)}),
+                content=orjson.dumps({"error": str(e)}),
                 status_code=500,
                 media_type="application/json"
             )
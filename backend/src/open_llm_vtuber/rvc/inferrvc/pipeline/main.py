@@ -3,7 +3,7 @@ import os
 import traceback
 from functools import lru_cache
 from time import time as ttime
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
 
 import faiss
 import librosa
@@ -22,9 +22,11 @@ bh, ah = signal.butter(N=5, Wn=48, btype="high", fs=16000)
 input_audio_path2wav = {}
 
 class ModelCache:
-    """Class to handle model caching for both HuBERT and RMVPE models."""
+    """Class to handle model caching for HuBERT and RMVPE models and FAISS indexes."""
     _hubert_models: Dict[str, Any] = {}
     _rmvpe_models: Dict[str, Any] = {}
+    # realpath -> (mtime_ns, index, big_npy)
+    _indexes: Dict[str, Tuple[int, Any, np.ndarray]] = {}
     
     @classmethod
     def get_hubert(cls, key: str, loader_func) -> Any:
@@ -40,11 +42,26 @@ class ModelCache:
             cls._rmvpe_models[key] = loader_func()
         return cls._rmvpe_models[key]
     
+    @classmethod
+    def get_index(cls, file_index: str) -> Tuple[Any, np.ndarray]:
+        """Get a FAISS index and its reconstructed vectors, reloading if the file changed."""
+        key = os.path.realpath(file_index)
+        mtime = os.stat(key).st_mtime_ns
+        entry = cls._indexes.get(key)
+        if entry is None or entry[0] != mtime:
+            index = faiss.read_index(key)
+            # Only gathered and mixed per frame, never searched: fp16 halves its
+            # footprint and memory traffic, and mixing upcasts to fp32
+            big_npy = index.reconstruct_n(0, index.ntotal).astype(np.float16)
+            entry = cls._indexes[key] = (mtime, index, big_npy)
+        return entry[1], entry[2]
+
     @classmethod
     def clear(cls):
         """Clear all cached models."""
         cls._hubert_models.clear()
         cls._rmvpe_models.clear()
+        cls._indexes.clear()
 
 @lru_cache
 def cache_harvest_f0(input_audio_path, fs, f0max, f0min, frame_period):
@@ -440,17 +457,9 @@ class Pipeline(object):
             and index_rate != 0
         ):
             try:
-                logger.info("Loading FAISS index...")
-                index_load_file_start = ttime()
-                index = faiss.read_index(file_index)
-                index_load_file_time = ttime() - index_load_file_start
-                logger.info(f"FAISS index file loaded in {index_load_file_time:.3f}s")
-
-                reconstruct_start = ttime()
-                big_npy = index.reconstruct_n(0, index.ntotal)
-                reconstruct_time = ttime() - reconstruct_start
-                logger.info(f"Index reconstruction completed in {reconstruct_time:.3f}s")
-                logger.info(f"Index loaded successfully with {index.ntotal} entries")
+                # Shared across calls and engines; only the first use reads the file
+                index, big_npy = ModelCache.get_index(file_index)
+                logger.info(f"Index ready with {index.ntotal} entries")
             except:
                 logger.warning("Failed to load index, continuing without it")
                 traceback.print_exc()
@@ -105,7 +105,9 @@ class ServiceContext:
         self.agent_engine = agent_engine
         self.translate_engine = translate_engine
 
-        logger.debug(f"Loaded service context with cache: {character_config}")
+        logger.opt(lazy=True).debug(
+            "Loaded service context with cache: {}", lambda: character_config
+        )
 
     def load_from_config(self, config: Config) -> None:
         """
@@ -115,6 +117,18 @@ class ServiceContext:
         Parameters:
         - config (Dict): The configuration dictionary.
         """
+        # Session contexts share config objects with the default context until
+        # they switch; the init_* methods record what they set up on
+        # character_config, so take a private copy before they write to it
+        if self.character_config is not None:
+            self.character_config = self.character_config.model_copy(
+                update={
+                    "tts_preprocessor_config": (
+                        self.character_config.tts_preprocessor_config.model_copy()
+                    )
+                }
+            )
+
         if not self.config:
             self.config = config
 
@@ -341,9 +355,10 @@ class ServiceContext:
                 }
                 new_config = validate_config(new_config)
                 self.load_from_config(new_config)
-                logger.debug(f"New config: {self}")
-                logger.debug(
-                    f"New character config: {self.character_config.model_dump()}"
+                logger.opt(lazy=True).debug("New config: {}", lambda: self)
+                logger.opt(lazy=True).debug(
+                    "New character config: {}",
+                    lambda: self.character_config.model_dump(),
                 )
 
                 # Send responses to client
@@ -403,7 +418,9 @@ class ServiceContext:
             # Read the character config file
             try:
                 char_config_data = read_yaml(config_file_path)
-                logger.debug(f"Read character config data: {char_config_data}")
+                logger.opt(lazy=True).debug(
+                    "Read character config data: {}", lambda: char_config_data
+                )
             except Exception as e:
                 logger.error(f"Failed to read YAML from {config_file_path}: {e}")
                 raise ValueError(f"Invalid YAML in character config file: {e}")
@@ -412,14 +429,22 @@ class ServiceContext:
                 raise ValueError(f"Invalid character config file (missing 'character_config' section): {config_file_path}")
             
             # Start with original config data and perform a deep merge
-            logger.debug(f"Original character config: {self.config.character_config.model_dump()}")
-            logger.debug(f"New character config to merge: {char_config_data['character_config']}")
+            logger.opt(lazy=True).debug(
+                "Original character config: {}",
+                lambda: self.config.character_config.model_dump(),
+            )
+            logger.opt(lazy=True).debug(
+                "New character config to merge: {}",
+                lambda: char_config_data["character_config"],
+            )
             
             new_character_config_data = deep_merge(
                 self.config.character_config.model_dump(),
                 char_config_data["character_config"]
             )
-            logger.debug(f"Merged character config: {new_character_config_data}")
+            logger.opt(lazy=True).debug(
+                "Merged character config: {}", lambda: new_character_config_data
+            )
             
             # Create a new config with the updated character config
             new_config = {
@@ -438,7 +463,7 @@ class ServiceContext:
             logger.info(f"Successfully loaded character config: {self.character_config.conf_name}")
             
         except Exception as e:
-            logger.error(f"Error loading character config: {e}", exc_info=True)
+            logger.error(f"Error loading character config: {e}")
             raise
 
 
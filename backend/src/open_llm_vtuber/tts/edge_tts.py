@@ -1,15 +1,19 @@
+import asyncio
+import socket
 import sys
 import os
-import tempfile
+import threading
+import time
 from pathlib import Path
 
+import aiohttp
+from aiohttp.abc import AbstractResolver
 import edge_tts
 import soundfile as sf
 from loguru import logger
 from .tts_interface import TTSInterface
 from ..rvc.inferrvc import VC
-from ..rvc.inferrvc.pipeline.main import Pipeline
-import faiss
+from ..rvc.inferrvc.pipeline.main import ModelCache, Pipeline
 
 current_dir = os.path.dirname(os.path.abspath(__file__))
 sys.path.append(current_dir)
@@ -20,6 +24,35 @@ os.environ["index_root"] = os.path.join(os.path.dirname(current_dir), "models",
 # Check out doc at https://github.com/rany2/edge-tts
 # Use `edge-tts --list-voices` to list all available voices
 
+# Seconds a resolved speech service address is reused
+DNS_TTL = 300
+
+
+class _CachingResolver(AbstractResolver):
+    """
+    DNS resolver shared by every edge-tts request of an engine. edge-tts
+    opens a new session and websocket per synthesis, so without it each
+    sentence pays for its own lookup of the speech service host.
+    """
+
+    def __init__(self, ttl=DNS_TTL):
+        self._resolver = aiohttp.DefaultResolver()
+        self._ttl = ttl
+        self._cache = {}
+
+    async def resolve(self, host, port=0, family=socket.AF_INET):
+        key = (host, port, family)
+        now = time.monotonic()
+        cached = self._cache.get(key)
+        if cached is not None and cached[0] > now:
+            return cached[1]
+        addrs = await self._resolver.resolve(host, port, family)
+        self._cache[key] = (now + self._ttl, addrs)
+        return addrs
+
+    async def close(self):
+        await self._resolver.close()
+
 
 class EdgeTTSEngine(TTSInterface):
     def __init__(self, voice="en-US-AvaMultilingualNeural", rvc_config=None):
@@ -29,6 +62,9 @@ class EdgeTTSEngine(TTSInterface):
         self.rvc_pipeline = None
         self.rvc_index = None
         self.rvc_big_npy = None
+        self._rvc_lock = threading.Lock()
+        # Created on first async use, as it binds to the running event loop
+        self._resolver = None
 
         self.temp_audio_file = "temp"
         self.file_extension = "mp3"
@@ -53,8 +89,8 @@ class EdgeTTSEngine(TTSInterface):
                 index_path = self.rvc_config.get("index_path", "models/rvc/houshou/added_IVF405_Flat_nprobe_1_Houshou_Marine_v2.index")
                 if os.path.exists(index_path):
                     try:
-                        self.rvc_index = faiss.read_index(index_path)
-                        self.rvc_big_npy = self.rvc_index.reconstruct_n(0, self.rvc_index.ntotal)
+                        # Warms the pipeline's shared cache, which vc_inference reads from
+                        self.rvc_index, self.rvc_big_npy = ModelCache.get_index(index_path)
                         logger.info("RVC index pre-loaded successfully")
                     except Exception as e:
                         logger.error(f"Failed to pre-load RVC index: {e}")
@@ -98,9 +134,64 @@ class EdgeTTSEngine(TTSInterface):
             logger.critical("It's possible that edge-tts is blocked in your region.")
             return None
 
+        return self._apply_rvc(file_name)
+
+    async def async_generate_audio(self, text, file_name_no_ext=None):
+        """
+        Generate speech audio file using TTS without blocking the event loop.
+        The edge-tts download runs natively async; RVC runs in a worker thread.
+        text: str
+            the text to speak
+        file_name_no_ext: str
+            name of the file without extension
+
+        Returns:
+        str: the path to the generated audio file
+        """
+        file_name = self.generate_cache_file_name(file_name_no_ext, self.file_extension)
+
+        if self._resolver is None:
+            self._resolver = _CachingResolver()
+
+        try:
+            # edge-tts closes the connector with its session; the resolver is kept
+            communicate = edge_tts.Communicate(
+                text,
+                self.voice,
+                connector=aiohttp.TCPConnector(resolver=self._resolver),
+            )
+            await communicate.save(file_name)
+        except Exception as e:
+            logger.critical(f"\nError: edge-tts unable to generate audio: {e}")
+            logger.critical("It's possible that edge-tts is blocked in your region.")
+            return None
+
+        if not self._rvc_ready():
+            return file_name
+        return await asyncio.to_thread(self._apply_rvc, file_name)
+
+    def _rvc_ready(self):
+        """Whether RVC is configured and its components are pre-loaded"""
+        return bool(
+            self.rvc_config and self.rvc_config.get("use_rvc", False) and
+            self.vc and self.rvc_pipeline and self.rvc_index is not None
+        )
+
+    def _apply_rvc(self, file_name):
+        """
+        Convert the generated audio with RVC, if RVC is ready. The converted
+        audio replaces the source file as a .wav.
+
+        Returns:
+        str: the path to the audio file
+        """
+        # The VC model and pipeline keep per-call state; one conversion at a time
+        with self._rvc_lock:
+            return self._convert_with_rvc(file_name)
+
+    def _convert_with_rvc(self, file_name):
         # Apply RVC if configured and components are pre-loaded
-        if (self.rvc_config and self.rvc_config.get("use_rvc", False) and 
-            self.vc and self.rvc_pipeline and self.rvc_index is not None):
+        if self._rvc_ready():
             try:
                 # Convert the audio using RVC with optimized parameters
                 tgt_sr, audio_opt, times, info = self.vc.vc_inference(
@@ -119,14 +210,13 @@ class EdgeTTSEngine(TTSInterface):
                     logger.error(f"Error in RVC conversion: {info}")
                     return file_name
 
-                # Save the converted audio
+                # Save the converted audio next to the source, with a matching extension
                 if audio_opt is not None:
-                    # Create a temporary file for the converted audio
-                    with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as temp_file:
-                        sf.write(temp_file.name, audio_opt, tgt_sr)
-                        # Replace the original file with the converted one
-                        os.replace(temp_file.name, file_name)
-                        logger.info("RVC conversion completed successfully")
+                    wav_file_name = str(Path(file_name).with_suffix(".wav"))
+                    sf.write(wav_file_name, audio_opt, tgt_sr, format="WAV", subtype="PCM_16")
+                    os.remove(file_name)
+                    logger.info("RVC conversion completed successfully")
+                    return wav_file_name
 
             except Exception as e:
                 logger.error(f"Error in RVC conversion: {e}")
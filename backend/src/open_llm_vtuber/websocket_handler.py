@@ -1,9 +1,12 @@
-from typing import Dict, List, Optional, Callable, TypedDict
+from types import MappingProxyType
+from typing import Any, Awaitable, Dict, List, Mapping, Optional, Callable, Tuple, TypedDict
 from fastapi import WebSocket, WebSocketDisconnect
 import asyncio
-import json
-from enum import Enum
+import time
+from contextlib import aclosing
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import orjson
 from loguru import logger
 
 from .service_context import ServiceContext
@@ -12,6 +15,7 @@ from .chat_group import (
     handle_group_operation,
     handle_client_disconnect,
     broadcast_to_group,
+    send_or_close,
 )
 from .message_handler import message_handler
 from .utils.stream_audio import prepare_audio_payload
@@ -27,23 +31,118 @@ from .conversations.conversation_handler import (
     handle_group_interrupt,
     handle_individual_interrupt,
 )
-from .adapters import BackendAdapter, OrphiqAdapter
+from .adapters import ADAPTERS, BackendAdapter
 
+# Scale from 16-bit PCM to float samples in [-1, 1)
+PCM16_SCALE = np.float32(1.0 / 32768.0)
 
-class MessageType(Enum):
-    """Enum for WebSocket message types"""
+def _pcm16_to_float(pcm: bytes) -> np.ndarray:
+    """
+    Convert 16-bit little-endian PCM to float32 samples in [-1, 1). The
+    multiply by a float32 scalar casts and scales in one vectorised pass.
+    """
+    return np.frombuffer(pcm, dtype="<i2") * PCM16_SCALE
 
-    GROUP = ["add-client-to-group", "remove-client-from-group"]
-    HISTORY = [
-        "fetch-history-list",
-        "fetch-and-set-history",
-        "create-new-history",
-        "delete-history",
-    ]
-    CONVERSATION = ["mic-audio-end", "text-input", "ai-speak-signal"]
-    CONFIG = ["fetch-configs", "switch-config"]
-    CONTROL = ["interrupt-signal", "audio-play-start"]
-    DATA = ["mic-audio-data"]
+
+# Matches the stdlib encoder on non-str keys; numpy values are encoded natively
+_JSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+
+def _encode(value: Any) -> str:
+    """A single value as JSON text"""
+    return orjson.dumps(value, option=_JSON_OPTIONS).decode()
+
+
+def _send_json(websocket: WebSocket, payload: dict) -> Awaitable[None]:
+    """Send a payload as a JSON text frame, encoded with orjson"""
+    return websocket.send_text(_encode(payload))
+
+
+# Seconds a config or background directory listing is served from cache
+SCAN_CACHE_TTL = 10.0
+
+# Raw audio chunks queued per client ahead of VAD; beyond this the oldest is
+# dropped. VAD engines are shared and stateful, so one thread runs them all.
+VAD_QUEUE_SIZE = 32
+_VAD_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix="vad")
+
+
+def _run_vad(vad_engine, chunk: list) -> list:
+    """Drain a VAD engine's detect_speech generator for one chunk"""
+    return list(vad_engine.detect_speech(chunk))
+
+
+# Invariant messages, encoded once
+_MSG_CONN_ESTABLISHED = orjson.dumps(
+    {"type": "full-text", "text": "Connection established"}
+).decode()
+_MSG_START_MIC = orjson.dumps({"type": "control", "text": "start-mic"}).decode()
+_MSG_EMPTY_GROUP = orjson.dumps(
+    {"type": "group-update", "members": [], "is_owner": False}
+).decode()
+
+# Fixed leading part of the command acks; only the fields after it vary
+_EXPR_ACK_PREFIX = '{"type":"expression-ack","expression_id":'
+_MOTION_ACK_PREFIX = '{"type":"motion-ack","motion_group":'
+
+BACKEND_MODES = ("orphiq", "external-api", "autonomous")
+# Replies naming a backend mode; the set of modes is fixed, so all are prebuilt
+_MSG_BACKEND_MODE_SET = {
+    mode: orjson.dumps({"type": "backend-mode-set", "mode": mode}).decode()
+    for mode in BACKEND_MODES
+}
+_MSG_BACKEND_MODE = {
+    mode: orjson.dumps({"type": "backend-mode", "mode": mode}).decode()
+    for mode in BACKEND_MODES
+}
+
+
+class MessageType:
+    """WebSocket message types, by category"""
+
+    GROUP = frozenset({"add-client-to-group", "remove-client-from-group"})
+    HISTORY = frozenset(
+        {
+            "fetch-history-list",
+            "fetch-and-set-history",
+            "create-new-history",
+            "delete-history",
+        }
+    )
+    CONVERSATION = frozenset({"mic-audio-end", "text-input", "ai-speak-signal"})
+    CONFIG = frozenset({"fetch-configs", "switch-config"})
+    CONTROL = frozenset({"interrupt-signal", "audio-play-start"})
+    DATA = frozenset({"mic-audio-data"})
+
+
+# Message type -> name of the WebSocketHandler method that handles it
+_MESSAGE_HANDLERS: Mapping[str, str] = MappingProxyType(
+    {
+        "add-client-to-group": "_handle_group_operation",
+        "remove-client-from-group": "_handle_group_operation",
+        "request-group-info": "_handle_group_info",
+        "fetch-history-list": "_handle_history_list_request",
+        "fetch-and-set-history": "_handle_fetch_history",
+        "create-new-history": "_handle_create_history",
+        "delete-history": "_handle_delete_history",
+        "interrupt-signal": "_handle_interrupt",
+        "mic-audio-data": "_handle_audio_data",
+        "mic-audio-end": "_handle_conversation_trigger",
+        "raw-audio-data": "_handle_raw_audio_data",
+        "text-input": "_handle_conversation_trigger",
+        "ai-speak-signal": "_handle_conversation_trigger",
+        "fetch-configs": "_handle_fetch_configs",
+        "switch-config": "_handle_config_switch",
+        "fetch-backgrounds": "_handle_fetch_backgrounds",
+        "audio-play-start": "_handle_audio_play_start",
+        # New handlers for Phase 1
+        "expression-command": "_handle_expression_command",
+        "motion-command": "_handle_motion_command",
+        "text-generation-request": "_handle_text_generation_request",
+        "set-backend-mode": "_handle_set_backend_mode",
+        "get-backend-mode": "_handle_get_backend_mode",
+    }
+)
 
 
 class WSMessage(TypedDict, total=False):
@@ -69,41 +168,28 @@ class WebSocketHandler:
         self.chat_group_manager = ChatGroupManager()
         self.current_conversation_tasks: Dict[str, Optional[asyncio.Task]] = {}
         self.default_context_cache = default_context_cache
-        self.received_data_buffers: Dict[str, np.ndarray] = {}
+        # Audio chunks per client, joined once when the utterance ends; None
+        # until the client first sends audio
+        self.received_data_buffers: Dict[str, Optional[List[np.ndarray]]] = {}
 
         # Adapter management
         self.client_adapters: Dict[str, BackendAdapter] = {}
         self.backend_modes: Dict[str, str] = {}  # 'orphiq', 'external-api', 'autonomous'
 
-        # Message handlers mapping
-        self._message_handlers = self._init_message_handlers()
-
-    def _init_message_handlers(self) -> Dict[str, Callable]:
-        """Initialize message type to handler mapping"""
-        return {
-            "add-client-to-group": self._handle_group_operation,
-            "remove-client-from-group": self._handle_group_operation,
-            "request-group-info": self._handle_group_info,
-            "fetch-history-list": self._handle_history_list_request,
-            "fetch-and-set-history": self._handle_fetch_history,
-            "create-new-history": self._handle_create_history,
-            "delete-history": self._handle_delete_history,
-            "interrupt-signal": self._handle_interrupt,
-            "mic-audio-data": self._handle_audio_data,
-            "mic-audio-end": self._handle_conversation_trigger,
-            "raw-audio-data": self._handle_raw_audio_data,
-            "text-input": self._handle_conversation_trigger,
-            "ai-speak-signal": self._handle_conversation_trigger,
-            "fetch-configs": self._handle_fetch_configs,
-            "switch-config": self._handle_config_switch,
-            "fetch-backgrounds": self._handle_fetch_backgrounds,
-            "audio-play-start": self._handle_audio_play_start,
-            # New handlers for Phase 1
-            "expression-command": self._handle_expression_command,
-            "motion-command": self._handle_motion_command,
-            "text-generation-request": self._handle_text_generation_request,
-            "set-backend-mode": self._handle_set_backend_mode,
-            "get-backend-mode": self._handle_get_backend_mode,
+        # Encoded config/background listings: key -> (expiry, message)
+        self._scan_cache: Dict[tuple, Tuple[float, str]] = {}
+        # Encoded set-model-and-conf up to client_uid:
+        # (conf_uid, conf_name) -> (model_info it was encoded from, text)
+        self._model_conf_prefixes: Dict[Tuple[str, str], Tuple[dict, str]] = {}
+
+        # Per-client raw audio queues and the VAD workers draining them
+        self._vad_queues: Dict[str, asyncio.Queue] = {}
+        self._vad_workers: Dict[str, asyncio.Task] = {}
+
+        # Message handlers mapping, bound once so routing is a single lookup
+        self._message_handlers: Dict[str, Callable] = {
+            msg_type: getattr(self, name)
+            for msg_type, name in _MESSAGE_HANDLERS.items()
         }
 
     async def handle_new_connection(
@@ -148,10 +234,9 @@ class WebSocketHandler:
         """Store client data and initialize group status"""
         self.client_connections[client_uid] = websocket
         self.client_contexts[client_uid] = session_service_context
-        self.received_data_buffers[client_uid] = np.array([])
+        self.received_data_buffers[client_uid] = None
 
         self.chat_group_manager.client_group_map[client_uid] = ""
-        await self.send_group_update(websocket, client_uid)
 
     async def _send_initial_messages(
         self,
@@ -160,39 +245,46 @@ class WebSocketHandler:
         session_service_context: ServiceContext,
     ):
         """Send initial connection messages to the client"""
-        await websocket.send_text(
-            json.dumps({"type": "full-text", "text": "Connection established"})
-        )
-
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "set-model-and-conf",
-                    "model_info": session_service_context.live2d_model.model_info,
-                    "conf_name": session_service_context.character_config.conf_name,
-                    "conf_uid": session_service_context.character_config.conf_uid,
-                    "client_uid": client_uid,
-                }
-            )
-        )
+        await websocket.send_text(_MSG_CONN_ESTABLISHED)
+
+        # model_info can be large, so it's encoded once per config and model
+        # and only the client_uid is appended per connection. set_model
+        # replaces model_info, so the cached dict's identity detects a reload.
+        character_config = session_service_context.character_config
+        model_info = session_service_context.live2d_model.model_info
+        key = (character_config.conf_uid, character_config.conf_name)
+        entry = self._model_conf_prefixes.get(key)
+        if entry is not None and entry[0] is model_info:
+            prefix = entry[1]
+        else:
+            payload = {
+                "type": "set-model-and-conf",
+                "model_info": model_info,
+                "conf_name": character_config.conf_name,
+                "conf_uid": character_config.conf_uid,
+            }
+            encoded = orjson.dumps(payload, option=_JSON_OPTIONS).decode()
+            prefix = encoded[:-1] + ',"client_uid":'
+            self._model_conf_prefixes[key] = (model_info, prefix)
+        await websocket.send_text(prefix + orjson.dumps(client_uid).decode() + "}")
 
         # Send initial group status
         await self.send_group_update(websocket, client_uid)
 
         # Start microphone
-        await websocket.send_text(json.dumps({"type": "control", "text": "start-mic"}))
+        await websocket.send_text(_MSG_START_MIC)
 
     async def _init_service_context(self) -> ServiceContext:
-        """Initialize service context for a new session by cloning the default context"""
+        """
+        Initialize service context for a new session from the default context.
+        Config objects are shared, not copied: nothing mutates them in place
+        except load_from_config, which copies character_config first.
+        """
         session_service_context = ServiceContext()
         session_service_context.load_cache(
-            config=self.default_context_cache.config.model_copy(deep=True),
-            system_config=self.default_context_cache.system_config.model_copy(
-                deep=True
-            ),
-            character_config=self.default_context_cache.character_config.model_copy(
-                deep=True
-            ),
+            config=self.default_context_cache.config,
+            system_config=self.default_context_cache.system_config,
+            character_config=self.default_context_cache.character_config,
             live2d_model=self.default_context_cache.live2d_model,
             asr_engine=self.default_context_cache.asr_engine,
             tts_engine=self.default_context_cache.tts_engine,
@@ -215,19 +307,28 @@ class WebSocketHandler:
         try:
             while True:
                 try:
-                    data = await websocket.receive_json()
+                    message = await websocket.receive()
+                    if message["type"] == "websocket.disconnect":
+                        raise WebSocketDisconnect(message.get("code", 1000))
+                    # Binary frames carry mic audio; everything else is JSON
+                    if message.get("bytes") is not None:
+                        self._handle_binary_audio(client_uid, message["bytes"])
+                        continue
+                    data = orjson.loads(message["text"])
+                    # Handlers index into the payload, so only objects route
+                    if not isinstance(data, dict):
+                        logger.warning("Ignoring non-object JSON message")
+                        continue
                     message_handler.handle_message(client_uid, data)
                     await self._route_message(websocket, client_uid, data)
                 except WebSocketDisconnect:
                     raise
-                except json.JSONDecodeError:
+                except orjson.JSONDecodeError:
                     logger.error("Invalid JSON received")
                     continue
                 except Exception as e:
                     logger.error(f"Error processing message: {e}")
-                    await websocket.send_text(
-                        json.dumps({"type": "error", "message": str(e)})
-                    )
+                    await _send_json(websocket, {"type": "error", "message": str(e)})
                     continue
 
         except WebSocketDisconnect:
@@ -302,8 +403,14 @@ class WebSocketHandler:
         self.client_connections.pop(client_uid, None)
         self.client_contexts.pop(client_uid, None)
         self.received_data_buffers.pop(client_uid, None)
-        self.client_adapters.pop(client_uid, None)
+        adapter = self.client_adapters.pop(client_uid, None)
+        if adapter:
+            await adapter.close()
         self.backend_modes.pop(client_uid, None)
+        self._vad_queues.pop(client_uid, None)
+        vad_worker = self._vad_workers.pop(client_uid, None)
+        if vad_worker:
+            vad_worker.cancel()
         if client_uid in self.current_conversation_tasks:
             task = self.current_conversation_tasks[client_uid]
             if task and not task.done():
@@ -328,26 +435,17 @@ class WebSocketHandler:
         """Sends group information to a client"""
         group = self.chat_group_manager.get_client_group(client_uid)
         if group:
-            current_members = self.chat_group_manager.get_group_members(client_uid)
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "group-update",
-                        "members": current_members,
-                        "is_owner": group.owner_uid == client_uid,
-                    }
-                )
+            current_members = list(group.members)
+            await _send_json(
+                websocket,
+                {
+                    "type": "group-update",
+                    "members": current_members,
+                    "is_owner": group.owner_uid == client_uid,
+                },
             )
         else:
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "group-update",
-                        "members": [],
-                        "is_owner": False,
-                    }
-                )
-            )
+            await websocket.send_text(_MSG_EMPTY_GROUP)
 
     async def _handle_interrupt(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -379,10 +477,10 @@ class WebSocketHandler:
     ) -> None:
         """Handle request for chat history list"""
         context = self.client_contexts[client_uid]
-        histories = get_history_list(context.character_config.conf_uid)
-        await websocket.send_text(
-            json.dumps({"type": "history-list", "histories": histories})
+        histories = await asyncio.to_thread(
+            get_history_list, context.character_config.conf_uid
         )
+        await _send_json(websocket, {"type": "history-list", "histories": histories})
 
     async def _handle_fetch_history(
         self, websocket: WebSocket, client_uid: str, data: dict
@@ -395,42 +493,44 @@ class WebSocketHandler:
         context = self.client_contexts[client_uid]
         # Update history_uid in service context
         context.history_uid = history_uid
-        context.agent_engine.set_memory_from_history(
+        await asyncio.to_thread(
+            context.agent_engine.set_memory_from_history,
             conf_uid=context.character_config.conf_uid,
             history_uid=history_uid,
         )
 
         messages = [
             msg
-            for msg in get_history(
+            for msg in await asyncio.to_thread(
+                get_history,
                 context.character_config.conf_uid,
                 history_uid,
             )
             if msg["role"] != "system"
         ]
-        await websocket.send_text(
-            json.dumps({"type": "history-data", "messages": messages})
-        )
+        await _send_json(websocket, {"type": "history-data", "messages": messages})
 
     async def _handle_create_history(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
         """Handle creation of new chat history"""
         context = self.client_contexts[client_uid]
-        history_uid = create_new_history(context.character_config.conf_uid)
+        history_uid = await asyncio.to_thread(
+            create_new_history, context.character_config.conf_uid
+        )
         if history_uid:
             context.history_uid = history_uid
-            context.agent_engine.set_memory_from_history(
+            await asyncio.to_thread(
+                context.agent_engine.set_memory_from_history,
                 conf_uid=context.character_config.conf_uid,
                 history_uid=history_uid,
             )
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "new-history-created",
-                        "history_uid": history_uid,
-                    }
-                )
+            await _send_json(
+                websocket,
+                {
+                    "type": "new-history-created",
+                    "history_uid": history_uid,
+                },
             )
 
     async def _handle_delete_history(
@@ -442,18 +542,18 @@ class WebSocketHandler:
             return
 
         context = self.client_contexts[client_uid]
-        success = delete_history(
+        success = await asyncio.to_thread(
+            delete_history,
             context.character_config.conf_uid,
             history_uid,
         )
-        await websocket.send_text(
-            json.dumps(
-                {
-                    "type": "history-deleted",
-                    "success": success,
-                    "history_uid": history_uid,
-                }
-            )
+        await _send_json(
+            websocket,
+            {
+                "type": "history-deleted",
+                "success": success,
+                "history_uid": history_uid,
+            },
         )
         if history_uid == context.history_uid:
             context.history_uid = None
@@ -462,46 +562,99 @@ class WebSocketHandler:
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
         """Handle incoming audio data"""
-        logger.info(f"Received audio data for client {client_uid}")
-        logger.info(f"Audio data length: {len(data.get('audio', []))}")
-        logger.info(f"Current buffer size: {len(self.received_data_buffers[client_uid])}")
+        # Called for every mic packet: no per-call logging above debug, and
+        # lazy so nothing is formatted when debug is filtered out
+        logger.opt(lazy=True).debug(
+            "Audio data for client {}: {} samples",
+            lambda: client_uid,
+            lambda: len(data.get("audio", [])),
+        )
         
         audio_data = data.get("audio", [])
         if audio_data:
-            self.received_data_buffers[client_uid] = np.append(
-                self.received_data_buffers[client_uid],
-                np.array(audio_data, dtype=np.float32),
+            self._audio_buffer(client_uid).append(
+                np.asarray(audio_data, dtype=np.float32)
             )
-            logger.info(f"Updated buffer size: {len(self.received_data_buffers[client_uid])}")
+
+    def _audio_buffer(self, client_uid: str) -> List[np.ndarray]:
+        """The client's audio chunk list, created on first use"""
+        buffer = self.received_data_buffers[client_uid]
+        if buffer is None:
+            buffer = self.received_data_buffers[client_uid] = []
+        return buffer
+
+    def _handle_binary_audio(self, client_uid: str, payload: bytes) -> None:
+        """Buffer a binary frame of 16-bit little-endian mono PCM mic audio"""
+        if len(payload) % 2 != 0:
+            logger.warning(f"Dropping odd-length audio frame from {client_uid}")
+            return
+        self._audio_buffer(client_uid).append(_pcm16_to_float(payload))
 
     async def _handle_raw_audio_data(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
-        """Handle incoming raw audio data for VAD processing"""
-        context = self.client_contexts[client_uid]
-        logger.info("Processing raw audio data through VAD")
+        """Queue incoming raw audio data for the client's VAD worker"""
         chunk = data.get("audio", [])
-        if chunk:
-            logger.info(f"Chunk size: {len(chunk)}")
-            for audio_bytes in context.vad_engine.detect_speech(chunk):
-                if audio_bytes == b"<|PAUSE|>":
-                    logger.info("VAD detected pause")
-                    await websocket.send_text(
-                        json.dumps({"type": "control", "text": "interrupt"})
-                    )
-                elif audio_bytes == b"<|RESUME|>":
-                    logger.info("VAD detected resume")
-                    pass
-                elif len(audio_bytes) > 1024:
-                    logger.info("VAD detected speech activity")
-                    self.received_data_buffers[client_uid] = np.append(
-                        self.received_data_buffers[client_uid],
-                        np.frombuffer(audio_bytes, dtype=np.int16).astype(np.float32),
-                    )
-                    logger.info(f"Updated buffer size after VAD: {len(self.received_data_buffers[client_uid])}")
-                    await websocket.send_text(
-                        json.dumps({"type": "control", "text": "mic-audio-end"})
-                    )
+        if not chunk:
+            return
+
+        queue = self._vad_queues.get(client_uid)
+        if queue is None:
+            queue = self._vad_queues[client_uid] = asyncio.Queue(
+                maxsize=VAD_QUEUE_SIZE
+            )
+            self._vad_workers[client_uid] = asyncio.create_task(
+                self._vad_worker(websocket, client_uid, queue)
+            )
+        if queue.full():
+            # VAD is falling behind; the oldest audio is the least useful
+            queue.get_nowait()
+            logger.warning(f"VAD backlog full for {client_uid}, dropping oldest chunk")
+        queue.put_nowait(chunk)
+
+    async def _vad_worker(
+        self, websocket: WebSocket, client_uid: str, queue: asyncio.Queue
+    ) -> None:
+        """Run VAD on a client's queued raw audio, in order, off the event loop"""
+        loop = asyncio.get_running_loop()
+        while True:
+            chunk = await queue.get()
+            context = self.client_contexts.get(client_uid)
+            if context is None:
+                return
+            # Once per raw audio packet, so debug only and lazily formatted
+            logger.opt(lazy=True).debug(
+                "Running VAD on {} samples", lambda: len(chunk)
+            )
+            try:
+                results = await loop.run_in_executor(
+                    _VAD_POOL, _run_vad, context.vad_engine, chunk
+                )
+                for audio_bytes in results:
+                    if audio_bytes == b"<|PAUSE|>":
+                        logger.info("VAD detected pause")
+                        await _send_json(
+                            websocket,
+                            {"type": "control", "text": "interrupt"},
+                        )
+                    elif audio_bytes == b"<|RESUME|>":
+                        logger.info("VAD detected resume")
+                        pass
+                    elif len(audio_bytes) > 1024:
+                        logger.info("VAD detected speech activity")
+                        self._audio_buffer(client_uid).append(
+                            _pcm16_to_float(audio_bytes)
+                        )
+                        logger.opt(lazy=True).debug(
+                            "Buffered chunks after VAD: {}",
+                            lambda: len(self.received_data_buffers[client_uid]),
+                        )
+                        await _send_json(
+                            websocket,
+                            {"type": "control", "text": "mic-audio-end"},
+                        )
+            except Exception as e:
+                logger.error(f"Error running VAD for {client_uid}: {e}")
 
     async def _handle_conversation_trigger(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -526,9 +679,15 @@ class WebSocketHandler:
     ) -> None:
         """Handle fetching available configurations"""
         context = self.client_contexts[client_uid]
-        config_files = scan_config_alts_directory(context.system_config.config_alts_dir)
+        config_alts_dir = context.system_config.config_alts_dir
         await websocket.send_text(
-            json.dumps({"type": "config-files", "configs": config_files})
+            await self._cached_scan(
+                ("config-files", config_alts_dir),
+                lambda: {
+                    "type": "config-files",
+                    "configs": scan_config_alts_directory(config_alts_dir),
+                },
+            )
         )
 
     async def _handle_config_switch(
@@ -539,14 +698,33 @@ class WebSocketHandler:
         if config_file_name:
             context = self.client_contexts[client_uid]
             await context.handle_config_switch(websocket, config_file_name)
+            # Config names shown in listings may have changed on disk
+            self._scan_cache.clear()
+            self._model_conf_prefixes.clear()
+
+    async def _cached_scan(self, key: tuple, build: Callable[[], dict]) -> str:
+        """
+        Return the encoded message `build` produces, rebuilding it in a worker
+        thread at most once per SCAN_CACHE_TTL seconds per key.
+        """
+        now = time.monotonic()
+        entry = self._scan_cache.get(key)
+        if entry is not None and entry[0] > now:
+            return entry[1]
+        message = await asyncio.to_thread(build)
+        text = orjson.dumps(message, option=_JSON_OPTIONS).decode()
+        self._scan_cache[key] = (now + SCAN_CACHE_TTL, text)
+        return text
 
     async def _handle_fetch_backgrounds(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
     ) -> None:
         """Handle fetching available background images"""
-        bg_files = scan_bg_directory()
         await websocket.send_text(
-            json.dumps({"type": "background-files", "files": bg_files})
+            await self._cached_scan(
+                ("background-files",),
+                lambda: {"type": "background-files", "files": scan_bg_directory()},
+            )
         )
 
     async def _handle_audio_play_start(
@@ -555,19 +733,21 @@ class WebSocketHandler:
         """
         Handle audio playback start notification
         """
-        group_members = self.chat_group_manager.get_group_members(client_uid)
-        if len(group_members) > 1:
-            display_text = data.get("display_text")
-            if display_text:
-                silent_payload = prepare_audio_payload(
-                    audio_path=None,
-                    display_text=display_text,
-                    actions=None,
-                    forwarded=True,
-                )
-                await self.broadcast_to_group(
-                    group_members, silent_payload, exclude_uid=client_uid
-                )
+        group = self.chat_group_manager.get_client_group(client_uid)
+        # Solo clients (the common case) have no one to forward to
+        if group is None or len(group.members) <= 1:
+            return
+        display_text = data.get("display_text")
+        if display_text:
+            silent_payload = prepare_audio_payload(
+                audio_path=None,
+                display_text=display_text,
+                actions=None,
+                forwarded=True,
+            )
+            await self.broadcast_to_group(
+                list(group.members), silent_payload, exclude_uid=client_uid
+            )
 
     async def _handle_group_info(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -575,6 +755,21 @@ class WebSocketHandler:
         """Handle group info request"""
         await self.send_group_update(websocket, client_uid)
 
+    async def _send_with_timeout(self, client_uid: str, msg: bytes | str) -> None:
+        """
+        Send a frame to a client through send_or_close, which closes the
+        connection if the send stays blocked
+
+        Raises:
+            asyncio.TimeoutError: If the send timed out
+        """
+        websocket = self.client_connections.get(client_uid)
+        if websocket is None:
+            return
+        # Pre-encoded JSON goes out as-is in a binary frame
+        send = websocket.send_bytes if isinstance(msg, bytes) else websocket.send_text
+        await send_or_close(websocket, client_uid, send(msg))
+
     def _get_adapter(self, client_uid: str) -> BackendAdapter:
         """Get or create adapter for client"""
         if client_uid not in self.client_adapters:
@@ -583,21 +778,21 @@ class WebSocketHandler:
                 raise ValueError(f"No context found for client {client_uid}")
 
             mode = self.backend_modes.get(client_uid, "orphiq")
+            adapter_cls = ADAPTERS.get(mode)
+            if adapter_cls is None:
+                # Future: register other adapter types
+                raise ValueError(f"Backend mode '{mode}' not yet implemented")
 
-            if mode == "orphiq":
-                # Create websocket send function
-                async def websocket_send(msg: str) -> None:
-                    websocket = self.client_connections.get(client_uid)
-                    if websocket:
-                        await websocket.send_text(msg)
+            # The adapter queues frames for a single writer calling this, so a
+            # slow client backs up into that bounded queue and then blocks the
+            # producer, never memory.
+            async def websocket_send(msg: bytes | str) -> None:
+                await self._send_with_timeout(client_uid, msg)
 
-                self.client_adapters[client_uid] = OrphiqAdapter(
-                    service_context=context,
-                    websocket_send=websocket_send,
-                )
-            else:
-                # Future: add other adapter types
-                raise ValueError(f"Backend mode '{mode}' not yet implemented")
+            self.client_adapters[client_uid] = adapter_cls(
+                service_context=context,
+                websocket_send=websocket_send,
+            )
 
         return self.client_adapters[client_uid]
 
@@ -608,10 +803,9 @@ class WebSocketHandler:
         try:
             expression_id = data.get("expression_id")
             if expression_id is None:
-                await websocket.send_text(
-                    json.dumps(
-                        {"type": "error", "message": "expression_id is required"}
-                    )
+                await _send_json(
+                    websocket,
+                    {"type": "error", "message": "expression_id is required"},
                 )
                 return
 
@@ -622,19 +816,11 @@ class WebSocketHandler:
             result = await adapter.trigger_expression(expression_id, duration, priority)
 
             await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "expression-ack",
-                        "expression_id": expression_id,
-                        "result": result,
-                    }
-                )
+                f'{_EXPR_ACK_PREFIX}{_encode(expression_id)},"result":{_encode(result)}}}'
             )
         except Exception as e:
             logger.error(f"Error handling expression command: {e}")
-            await websocket.send_text(
-                json.dumps({"type": "error", "message": str(e)})
-            )
+            await _send_json(websocket, {"type": "error", "message": str(e)})
 
     async def _handle_motion_command(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -645,13 +831,12 @@ class WebSocketHandler:
             motion_index = data.get("motion_index")
 
             if motion_group is None or motion_index is None:
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "type": "error",
-                            "message": "motion_group and motion_index are required",
-                        }
-                    )
+                await _send_json(
+                    websocket,
+                    {
+                        "type": "error",
+                        "message": "motion_group and motion_index are required",
+                    },
                 )
                 return
 
@@ -664,20 +849,12 @@ class WebSocketHandler:
             )
 
             await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "motion-ack",
-                        "motion_group": motion_group,
-                        "motion_index": motion_index,
-                        "result": result,
-                    }
-                )
+                f'{_MOTION_ACK_PREFIX}{_encode(motion_group)},'
+                f'"motion_index":{_encode(motion_index)},"result":{_encode(result)}}}'
             )
         except Exception as e:
             logger.error(f"Error handling motion command: {e}")
-            await websocket.send_text(
-                json.dumps({"type": "error", "message": str(e)})
-            )
+            await _send_json(websocket, {"type": "error", "message": str(e)})
 
     async def _handle_text_generation_request(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -686,42 +863,28 @@ class WebSocketHandler:
         try:
             prompt = data.get("prompt", "")
             if not prompt:
-                await websocket.send_text(
-                    json.dumps({"type": "error", "message": "prompt is required"})
+                await _send_json(
+                    websocket,
+                    {"type": "error", "message": "prompt is required"},
                 )
                 return
 
             context = data.get("context", {})
 
             adapter = self._get_adapter(client_uid)
-            full_text = ""
-
-            async for text_chunk in adapter.generate_text(prompt, context):
-                full_text += text_chunk
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "type": "text-generation-chunk",
-                            "text": text_chunk,
-                            "is_complete": False,
-                        }
-                    )
-                )
 
-            await websocket.send_text(
-                json.dumps(
-                    {
-                        "type": "text-generation-response",
-                        "text": full_text,
-                        "is_complete": True,
-                    }
-                )
-            )
+            # Chunk frames and the final response arrive pre-encoded
+            frames = adapter.generate_text_frames(prompt, context)
+            # Closed explicitly so its reader task stops if a send fails
+            async with aclosing(frames):
+                async for frame in frames:
+                    await self._send_with_timeout(client_uid, frame)
+        except asyncio.TimeoutError:
+            # The stalled client has been disconnected; nothing to reply to
+            return
         except Exception as e:
             logger.error(f"Error handling text generation request: {e}")
-            await websocket.send_text(
-                json.dumps({"type": "error", "message": str(e)})
-            )
+            await _send_json(websocket, {"type": "error", "message": str(e)})
 
     async def _handle_set_backend_mode(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -729,32 +892,32 @@ class WebSocketHandler:
         """Handle backend mode switching"""
         try:
             mode = data.get("mode", "orphiq")
-            if mode not in ["orphiq", "external-api", "autonomous"]:
-                await websocket.send_text(
-                    json.dumps(
-                        {
-                            "type": "error",
-                            "message": f"Invalid backend mode: {mode}. Must be one of: orphiq, external-api, autonomous",
-                        }
-                    )
+            # The prebuilt reply doubles as the validity check; a non-string
+            # mode from the client would be unhashable or can't match anyway
+            reply = _MSG_BACKEND_MODE_SET.get(mode) if isinstance(mode, str) else None
+            if reply is None:
+                await _send_json(
+                    websocket,
+                    {
+                        "type": "error",
+                        "message": f"Invalid backend mode: {mode}. Must be one of: {', '.join(BACKEND_MODES)}",
+                    },
                 )
                 return
 
             # Clear existing adapter
-            self.client_adapters.pop(client_uid, None)
+            adapter = self.client_adapters.pop(client_uid, None)
+            if adapter:
+                await adapter.close()
             self.backend_modes[client_uid] = mode
 
             # Create new adapter
             _ = self._get_adapter(client_uid)
 
-            await websocket.send_text(
-                json.dumps({"type": "backend-mode-set", "mode": mode})
-            )
+            await websocket.send_text(reply)
         except Exception as e:
             logger.error(f"Error setting backend mode: {e}")
-            await websocket.send_text(
-                json.dumps({"type": "error", "message": str(e)})
-            )
+            await _send_json(websocket, {"type": "error", "message": str(e)})
 
     async def _handle_get_backend_mode(
         self, websocket: WebSocket, client_uid: str, data: WSMessage
@@ -762,11 +925,7 @@ class WebSocketHandler:
         """Handle get backend mode request"""
         try:
             mode = self.backend_modes.get(client_uid, "orphiq")
-            await websocket.send_text(
-                json.dumps({"type": "backend-mode", "mode": mode})
-            )
+            await websocket.send_text(_MSG_BACKEND_MODE[mode])
         except Exception as e:
             logger.error(f"Error getting backend mode: {e}")
-            await websocket.send_text(
-                json.dumps({"type": "error", "message": str(e)})
-            )
+            await _send_json(websocket, {"type": "error", "message": str(e)})
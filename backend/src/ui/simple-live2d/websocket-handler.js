@@ -594,17 +594,37 @@ function sendInterruptSignal() {
     send({ type: 'interrupt-signal', text: '' });
 }
 
+// Send mic samples as one binary frame of 16-bit PCM
+function sendAudioData(chunks) {
+    if (!isConnected) {
+        console.log('WebSocket not connected, dropping mic audio');
+        return;
+    }
+
+    const length = chunks.reduce((total, chunk) => total + chunk.length, 0);
+    const pcm = new Int16Array(length);
+    let offset = 0;
+    for (const chunk of chunks) {
+        for (let i = 0; i < chunk.length; i++) {
+            const sample = Math.max(-1, Math.min(1, chunk[i]));
+            pcm[offset++] = sample < 0 ? sample * 0x8000 : sample * 0x7fff;
+        }
+    }
+
+    try {
+        socket.send(pcm.buffer);
+    } catch (error) {
+        console.error('Error sending audio:', error);
+    }
+}
+
 function sendAudioEnd() {
+    // Flush the samples not yet sent so they are part of the utterance
     if (audioChunks.length > 0) {
-        const audioData = audioChunks.flat();
-        send({ 
-            type: 'mic-audio-end', 
-            audio: audioData 
-        });
+        sendAudioData(audioChunks);
         audioChunks = [];
-    } else {
-        send({ type: 'mic-audio-end' });
     }
+    send({ type: 'mic-audio-end' });
 }
 
 function sendAudioPlayStart(displayText) {
@@ -687,15 +707,12 @@ function startMicrophone() {
                 if (!isRecording) return;
                 
                 const inputData = e.inputBuffer.getChannelData(0);
-                audioChunks.push(Array.from(inputData));
+                // The input buffer is reused by the browser, so keep a copy
+                audioChunks.push(new Float32Array(inputData));
                 
                 // Send audio data in chunks
                 if (audioChunks.length >= 4) {
-                    const audioData = audioChunks.flat();
-                    send({ 
-                        type: 'mic-audio-data', 
-                        audio: audioData 
-                    });
+                    sendAudioData(audioChunks);
                     audioChunks = [];
                 }
             };
@@ -766,25 +783,44 @@ function sendTextToTts(text) {
     
     console.log(`Connecting to TTS WebSocket at ${ttsWsUrl}`);
     const ttsSocket = new WebSocket(ttsWsUrl);
+    ttsSocket.binaryType = 'arraybuffer';
+    // Audio bytes streamed ahead of the matching partial message
+    let streamedAudio = null;
     
     ttsSocket.onopen = () => {
         console.log('TTS WebSocket connection established');
-        ttsSocket.send(JSON.stringify({ text: text }));
+        ttsSocket.send(JSON.stringify({ text: text, stream: true }));
     };
     
     ttsSocket.onmessage = (event) => {
+        if (event.data instanceof ArrayBuffer) {
+            streamedAudio = event.data;
+            return;
+        }
         try {
             const data = JSON.parse(event.data);
             console.log('TTS response:', data);
             
-            if (data.status === 'partial' && data.audioPath) {
+            if (data.status === 'partial' && (streamedAudio || data.audioPath)) {
                 // Play the audio
-                const audio = new Audio(data.audioPath);
+                let source = data.audioPath;
+                if (streamedAudio) {
+                    source = URL.createObjectURL(new Blob([streamedAudio]));
+                    streamedAudio = null;
+                }
+                const audio = new Audio(source);
+                if (!data.audioPath) {
+                    audio.addEventListener('ended', () => URL.revokeObjectURL(source), { once: true });
+                }
                 audio.play().catch(error => {
                     console.error('Error playing TTS audio:', error);
                 });
+            } else if (data.status === 'complete') {
+                // One request per socket; free the server-side session
+                ttsSocket.close();
             } else if (data.status === 'error') {
                 console.error('TTS error:', data.message);
+                ttsSocket.close();
             }
         } catch (error) {
             console.error('Error parsing TTS message:', error);
@@ -6,6 +6,8 @@ let audioContext = null;
 let audioBuffers = [];
 let pendingAudioPaths = new Set();
 let currentAudioPath = null;
+// Audio bytes streamed ahead of the matching partial message
+let streamedAudio = null;
 let ws = null;
 
 // DOM Elements
@@ -115,6 +117,7 @@ stopRecordingBtn.addEventListener('click', async () => {
 function connectWebSocket() {
     const wsProtocol = window.location.protocol === 'https:' ? 'wss' : 'ws';
     ws = new WebSocket(`${wsProtocol}://${window.location.host}/tts-ws`);
+    ws.binaryType = 'arraybuffer';
     
     ws.onopen = () => {
         console.log('WebSocket connected');
@@ -131,23 +134,34 @@ function connectWebSocket() {
     };
 
     ws.onmessage = async (event) => {
+        if (event.data instanceof ArrayBuffer) {
+            // Audio for the partial message that follows
+            streamedAudio = event.data;
+            return;
+        }
         const response = JSON.parse(event.data);
         
         if (response.status === 'partial') {
             ttsStatus.textContent = 'Generating audio...';
             ttsStatus.className = 'status';
             
+            // Take the streamed bytes before any await so the next frame can't replace them
+            let arrayBuffer = streamedAudio;
+            streamedAudio = null;
+            const audioPath = arrayBuffer ? null : response.audioPath.split('/').pop();
+            const pendingKey = audioPath || Symbol('streamed audio');
             try {
-                const audioPath = response.audioPath.split('/').pop();
-                pendingAudioPaths.add(audioPath);
+                pendingAudioPaths.add(pendingKey);
                 
                 if (audioContext.state === 'suspended') {
                     await audioContext.resume();
                 }
                 
-                // Use retry mechanism for fetching audio
-                const audioResponse = await fetchWithRetry(`${API_BASE_URL}/cache/${audioPath}`);
-                const arrayBuffer = await audioResponse.arrayBuffer();
+                if (!arrayBuffer) {
+                    // Use retry mechanism for fetching audio
+                    const audioResponse = await fetchWithRetry(`${API_BASE_URL}/cache/${audioPath}`);
+                    arrayBuffer = await audioResponse.arrayBuffer();
+                }
                 
                 if (arrayBuffer.byteLength === 0) {
                     throw new Error('Empty audio data received');
@@ -155,7 +169,7 @@ function connectWebSocket() {
                 
                 const audioBuffer = await audioContext.decodeAudioData(arrayBuffer);
                 audioBuffers.push(audioBuffer);
-                pendingAudioPaths.delete(audioPath);
+                pendingAudioPaths.delete(pendingKey);
             } catch (error) {
                 console.error('Error loading audio:', error);
                 ttsStatus.textContent = 'Error loading audio: ' + error.message;
@@ -341,7 +355,7 @@ generateSpeechBtn.addEventListener('click', () => {
     }
 
     if (ws && ws.readyState === WebSocket.OPEN) {
-        ws.send(JSON.stringify({ text }));
+        ws.send(JSON.stringify({ text, stream: true }));
         ttsStatus.textContent = 'Generating audio...';
         ttsStatus.className = 'status';
     } else {
@@ -5,15 +5,39 @@ import asyncio
 from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Dict, Any
 
-from src.open_llm_vtuber.adapters import BackendAdapter, OrphiqAdapter
+from src.open_llm_vtuber.adapters import ADAPTERS, AdapterError, BackendAdapter, OrphiqAdapter
+from src.open_llm_vtuber.adapters.orphiq_adapter import _motion_frame
 from src.open_llm_vtuber.service_context import ServiceContext
 from src.open_llm_vtuber.agent.output_types import SentenceOutput, DisplayText, Actions
 
 
-@pytest.fixture
+def _sentence(text: str) -> SentenceOutput:
+    return SentenceOutput(
+        display_text=DisplayText(text=text), tts_text=text, actions=Actions()
+    )
+
+
+# Agent outputs shared by the text generation tests
+_HELLO = _sentence("Hello, ")
+_WORLD = _sentence("world!")
+_HELLO_WORLD = _sentence("Hello, world!")
+
+
+async def _stream_hello_world(input_data):
+    yield _HELLO_WORLD
+
+
+async def _stream_two(input_data):
+    yield _HELLO
+    yield _WORLD
+
+
+@pytest.fixture(scope="module")
 def mock_service_context():
-    """Create a mock service context"""
-    context = MagicMock(spec=ServiceContext)
+    """Create a mock service context, shared by the tests in this module"""
+    # Specced from an instance, as the attributes are assigned in __init__.
+    # Building the spec walks the class, so it's done once per module.
+    context = MagicMock(spec=ServiceContext())
     context.character_config.character_name = "TestCharacter"
     context.character_config.human_name = "Human"
     context.character_config.avatar = "test.png"
@@ -25,6 +49,13 @@ def mock_service_context():
     return context
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_service_context):
+    """Clear calls recorded on the shared service context after each test"""
+    yield
+    mock_service_context.reset_mock()
+
+
 @pytest.fixture
 def mock_websocket_send():
     """Create a mock websocket send function"""
@@ -48,63 +79,106 @@ class TestBackendAdapter:
         with pytest.raises(TypeError):
             BackendAdapter()
 
+    def test_orphiq_adapter_is_registered(self):
+        """Test that the orphiq backend mode resolves to OrphiqAdapter"""
+        assert ADAPTERS["orphiq"] is OrphiqAdapter
+
 
 class TestOrphiqAdapter:
     """Test OrphiqAdapter implementation"""
 
     @pytest.mark.asyncio
-    async def test_generate_text_basic(self, orphiq_adapter, mock_service_context):
+    async def test_generate_text_basic(self, orphiq_adapter, mock_service_context, monkeypatch):
         """Test basic text generation"""
-        # Mock agent output
-        mock_output = SentenceOutput(
-            display_text=DisplayText(text="Hello, world!"),
-            tts_text="Hello, world!",
-            actions=Actions(),
-        )
+        monkeypatch.setattr(mock_service_context.agent_engine, "chat", _stream_hello_world)
         
-        async def mock_chat(input_data):
-            yield mock_output
+        # Generate text
+        texts = []
+        async for text in orphiq_adapter.generate_text("Test prompt"):
+            texts.append(text)
         
-        mock_service_context.agent_engine.chat = mock_chat
+        assert len(texts) == 1
+        assert texts[0] == "Hello, world!"
+
+    @pytest.mark.asyncio
+    async def test_generate_text_multiple_chunks(self, orphiq_adapter, mock_service_context, monkeypatch):
+        """Test text generation with multiple chunks"""
+        monkeypatch.setattr(mock_service_context.agent_engine, "chat", _stream_two)
         
         # Generate text
         texts = []
         async for text in orphiq_adapter.generate_text("Test prompt"):
             texts.append(text)
         
+        # Fragments are coalesced until the sentence ends
         assert len(texts) == 1
         assert texts[0] == "Hello, world!"
 
     @pytest.mark.asyncio
-    async def test_generate_text_multiple_chunks(self, orphiq_adapter, mock_service_context):
-        """Test text generation with multiple chunks"""
-        # Mock agent output with multiple sentences
-        outputs = [
-            SentenceOutput(
-                display_text=DisplayText(text="Hello, "),
-                tts_text="Hello, ",
-                actions=Actions(),
-            ),
-            SentenceOutput(
-                display_text=DisplayText(text="world!"),
-                tts_text="world!",
-                actions=Actions(),
-            ),
-        ]
+    async def test_generate_text_flushes_at_sentence_boundary(self, orphiq_adapter, mock_service_context, monkeypatch):
+        """Test that each completed sentence is yielded without waiting for more"""
+        outputs = [_sentence(text) for text in ["Hello.", "How are ", "you?"]]
         
         async def mock_chat(input_data):
             for output in outputs:
                 yield output
+                await asyncio.sleep(0.05)
         
-        mock_service_context.agent_engine.chat = mock_chat
+        monkeypatch.setattr(mock_service_context.agent_engine, "chat", mock_chat)
         
-        # Generate text
         texts = []
         async for text in orphiq_adapter.generate_text("Test prompt"):
             texts.append(text)
         
-        assert len(texts) == 2
-        assert "".join(texts) == "Hello, world!"
+        assert texts == ["Hello.", "How are ", "you?"]
+
+    @pytest.mark.asyncio
+    async def test_generate_text_merges_waiting_text(self, orphiq_adapter, mock_service_context, monkeypatch):
+        """Test that sentences already queued when a batch is yielded go out with it"""
+        outputs = [_sentence(text) for text in ["Hello. ", "How are ", "you?"]]
+        
+        async def mock_chat(input_data):
+            for output in outputs:
+                yield output
+        
+        monkeypatch.setattr(mock_service_context.agent_engine, "chat", mock_chat)
+        
+        texts = []
+        async for text in orphiq_adapter.generate_text("Test prompt"):
+            texts.append(text)
+        
+        assert texts == ["Hello. How are you?"]
+
+    @pytest.mark.asyncio
+    async def test_generate_text_flushes_when_agent_stalls(self, orphiq_adapter, mock_service_context, monkeypatch):
+        """Test that a pending batch is yielded at its deadline while the agent is quiet"""
+        async def mock_chat(input_data):
+            for output in (_HELLO, _WORLD):
+                yield output
+                await asyncio.sleep(0.2)
+        
+        monkeypatch.setattr(mock_service_context.agent_engine, "chat", mock_chat)
+        
+        texts = []
+        async for text in orphiq_adapter.generate_text("Test prompt"):
+            texts.append(text)
+        
+        assert texts == ["Hello, ", "world!"]
+
+    @pytest.mark.asyncio
+    async def test_generate_text_forwards_agent_cancellation(self, orphiq_adapter, mock_service_context, monkeypatch):
+        """Test that a CancelledError from the agent stream reaches the reader"""
+        async def mock_chat(input_data):
+            yield _HELLO_WORLD
+            raise asyncio.CancelledError
+        
+        monkeypatch.setattr(mock_service_context.agent_engine, "chat", mock_chat)
+        
+        async def read():
+            return [text async for text in orphiq_adapter.generate_text("Test prompt")]
+        
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(read(), timeout=1)
 
     @pytest.mark.asyncio
     async def test_trigger_expression(self, orphiq_adapter, mock_websocket_send):
@@ -114,6 +188,7 @@ class TestOrphiqAdapter:
             duration=1000,
             priority=1,
         )
+        await orphiq_adapter.flush()
         
         assert result["status"] == "success"
         assert result["expression_id"] == 0
@@ -128,6 +203,27 @@ class TestOrphiqAdapter:
         assert payload["type"] == "audio"
         assert payload["actions"]["expressions"] == [0]
 
+    def test_expression_frames_shared_per_character(self, mock_service_context):
+        """Test that adapters serving one character config share encoded frames"""
+        first = OrphiqAdapter(mock_service_context, AsyncMock())
+        second = OrphiqAdapter(mock_service_context, AsyncMock())
+        
+        frame = first._expression_frame(3)
+        
+        assert second._expression_frame(3) is frame
+
+    @pytest.mark.asyncio
+    async def test_trigger_expression_failure_raises(self, orphiq_adapter, mock_websocket_send):
+        """Test that a failed expression send raises AdapterError on the next command"""
+        mock_websocket_send.side_effect = RuntimeError("closed")
+        await orphiq_adapter.trigger_expression(expression_id=0)
+        await orphiq_adapter.flush()
+        
+        with pytest.raises(AdapterError, match="closed"):
+            await orphiq_adapter.trigger_expression(expression_id=1)
+        
+        assert orphiq_adapter._current_expression == 0
+
     @pytest.mark.asyncio
     async def test_trigger_motion(self, orphiq_adapter, mock_websocket_send):
         """Test motion triggering"""
@@ -137,6 +233,7 @@ class TestOrphiqAdapter:
             loop=True,
             priority=1,
         )
+        await orphiq_adapter.flush()
         
         assert result["status"] == "success"
         assert result["motion_group"] == "idle"
@@ -146,6 +243,46 @@ class TestOrphiqAdapter:
         # Verify websocket send was called
         assert mock_websocket_send.called
 
+    def test_motion_frame_cache_keeps_bool_and_int_apart(self):
+        """Test that equal bool and int arguments don't share a cached frame"""
+        import json
+        first = json.loads(_motion_frame("idle", 1, True, 0))
+        second = json.loads(_motion_frame("idle", True, 1, 0))
+        
+        assert first["motion_index"] == 1 and first["loop"] is True
+        assert second["motion_index"] is True and second["loop"] == 1
+
+    def test_expression_frame_cache_keeps_types_apart(self, orphiq_adapter):
+        """Test that equal int, float and bool expression ids don't share a cached frame"""
+        import json
+        frames = [
+            json.loads(orphiq_adapter._expression_frame(expression_id))
+            for expression_id in (True, 1, 1.0)
+        ]
+        
+        assert [frame["display_text"]["text"] for frame in frames] == [
+            "Expression True",
+            "Expression 1",
+            "Expression 1.0",
+        ]
+        assert frames[0]["actions"]["expressions"][0] is True
+        assert type(frames[1]["actions"]["expressions"][0]) is int
+
+    @pytest.mark.asyncio
+    async def test_queued_sends_preserve_order(self, orphiq_adapter, mock_websocket_send):
+        """Test that the writer task sends queued payloads in order"""
+        await orphiq_adapter.trigger_expression(expression_id=1)
+        await orphiq_adapter.trigger_motion("idle", 2)
+        await orphiq_adapter.trigger_expression(expression_id=3)
+        await orphiq_adapter.flush()
+        await orphiq_adapter.close()
+        
+        import json
+        payloads = [json.loads(call[0][0]) for call in mock_websocket_send.call_args_list]
+        assert [p["type"] for p in payloads] == ["audio", "motion-command", "audio"]
+        assert payloads[0]["actions"]["expressions"] == [1]
+        assert payloads[2]["actions"]["expressions"] == [3]
+
     @pytest.mark.asyncio
     async def test_get_character_state(self, orphiq_adapter):
         """Test getting character state"""
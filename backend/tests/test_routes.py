@@ -0,0 +1,240 @@
+"""Unit tests for HTTP and web tool routes"""
+
+import asyncio
+import io
+import json
+import struct
+import numpy as np
+import pytest
+from unittest.mock import AsyncMock, MagicMock
+from fastapi import FastAPI, UploadFile
+from fastapi.testclient import TestClient
+
+from src.open_llm_vtuber.routes import (
+    _read_pcm16_wav,
+    _split_sentences,
+    init_webtool_routes,
+)
+from src.open_llm_vtuber.service_context import ServiceContext
+
+
+def _wav(
+    samples, channels: int = 1, rate: int = 16000, bits: int = 16, extra: bytes = b""
+) -> UploadFile:
+    """A WAV upload of int16 samples, with `extra` chunks placed before data"""
+    data = np.asarray(samples, dtype="<i2").tobytes()
+    block_align = channels * bits // 8
+    fmt = struct.pack("<HHIIHH", 1, channels, rate, rate * block_align, block_align, bits)
+    body = (
+        b"WAVE"
+        + b"fmt " + struct.pack("<I", len(fmt)) + fmt
+        + extra
+        + b"data" + struct.pack("<I", len(data)) + data
+    )
+    return UploadFile(io.BytesIO(b"RIFF" + struct.pack("<I", len(body)) + body))
+
+
+@pytest.fixture
+def mock_service_context():
+    """Create a mock service context"""
+    context = MagicMock(spec=ServiceContext())
+    context.tts_engine = MagicMock()
+    return context
+
+
+@pytest.fixture
+def webtool_client(mock_service_context):
+    """Create a test client serving the web tool routes"""
+    app = FastAPI()
+    app.include_router(init_webtool_routes(default_context_cache=mock_service_context))
+    with TestClient(app) as client:
+        yield client
+
+
+class TestTTSWebSocket:
+    """Test the /tts-ws endpoint"""
+
+    def test_failed_request_cleans_up_unsent_audio(
+        self, webtool_client, mock_service_context
+    ):
+        """Test that audio finished for unsent sentences is removed after an error"""
+
+        async def generate(text, file_name_no_ext):
+            if text.startswith("First"):
+                await asyncio.sleep(0.05)
+                raise RuntimeError("engine failed")
+            return "cache/second.wav"
+
+        tts_engine = mock_service_context.tts_engine
+        tts_engine.async_generate_audio = AsyncMock(side_effect=generate)
+
+        with webtool_client.websocket_connect("/tts-ws") as websocket:
+            websocket.send_text(json.dumps({"text": "First one. Second one."}))
+            reply = json.loads(websocket.receive_text())
+
+        assert reply == {"status": "error", "message": "engine failed"}
+        tts_engine.remove_file.assert_called_once_with(
+            "cache/second.wav", verbose=False
+        )
+
+
+class TestReadPcm16Wav:
+    """Test WAV upload parsing for /asr"""
+
+    @pytest.mark.asyncio
+    async def test_mono(self):
+        """Test that mono 16-bit PCM is scaled to float32"""
+        audio = await _read_pcm16_wav(_wav([0, 16384, -32768]), sample_rate=16000)
+
+        assert audio.dtype == np.float32
+        np.testing.assert_allclose(audio, [0.0, 0.5, -1.0])
+
+    @pytest.mark.asyncio
+    async def test_stereo_is_downmixed(self):
+        """Test that stereo frames are averaged into mono samples"""
+        audio = await _read_pcm16_wav(
+            _wav([16384, -16384, 16384, 16384], channels=2), sample_rate=16000
+        )
+
+        np.testing.assert_allclose(audio, [0.0, 0.5])
+
+    @pytest.mark.asyncio
+    async def test_chunk_before_data_is_skipped(self):
+        """Test that chunks such as LIST ahead of data are skipped, padding included"""
+        # Odd-sized chunk, followed by its pad byte
+        extra = b"LIST" + struct.pack("<I", 5) + b"INFOx" + b"\0"
+
+        audio = await _read_pcm16_wav(_wav([16384, 0], extra=extra))
+
+        np.testing.assert_allclose(audio, [0.5, 0.0])
+
+    @pytest.mark.asyncio
+    async def test_wrong_sample_rate_is_rejected(self):
+        """Test that audio at another sample rate is rejected"""
+        with pytest.raises(ValueError, match="expected 16000 Hz"):
+            await _read_pcm16_wav(_wav([0, 0], rate=44100), sample_rate=16000)
+
+    @pytest.mark.asyncio
+    async def test_wrong_bit_depth_is_rejected(self):
+        """Test that non-16-bit audio is rejected"""
+        with pytest.raises(ValueError, match="expected 16-bit PCM"):
+            await _read_pcm16_wav(_wav([0, 0], bits=8))
+
+    @pytest.mark.asyncio
+    async def test_truncated_file_is_rejected(self):
+        """Test that a file shorter than a RIFF header is rejected"""
+        with pytest.raises(ValueError, match="File too small"):
+            await _read_pcm16_wav(UploadFile(io.BytesIO(b"RIFF")))
+
+    @pytest.mark.asyncio
+    async def test_truncated_data_returns_what_was_read(self):
+        """Test that data cut short of its declared size yields the samples read"""
+        wav = await _wav([16384, 16384, 16384]).read()
+        upload = UploadFile(io.BytesIO(wav[:-2]))
+
+        audio = await _read_pcm16_wav(upload)
+
+        np.testing.assert_allclose(audio, [0.5, 0.5])
+
+    @pytest.mark.asyncio
+    async def test_headerless_pcm(self):
+        """Test that input without RIFF/WAVE is read as a 44-byte header plus PCM"""
+        pcm = np.array([16384, -16384], dtype="<i2").tobytes()
+
+        audio = await _read_pcm16_wav(UploadFile(io.BytesIO(bytes(44) + pcm)))
+
+        np.testing.assert_allclose(audio, [0.5, -0.5])
+
+
+class TestSplitSentences:
+    """Test sentence splitting for /tts-ws"""
+
+    def test_splits_on_end_punctuation(self):
+        """Test that text splits after . ! ? followed by whitespace"""
+        assert _split_sentences("Hi there. How are you? Great!") == [
+            "Hi there.",
+            "How are you?",
+            "Great!",
+        ]
+
+    def test_decimals_stay_whole(self):
+        """Test that a period without following whitespace doesn't split"""
+        assert _split_sentences("It costs 3.50 today.") == ["It costs 3.50 today."]
+
+    def test_abbreviation_glued_to_lowercase_continuation(self):
+        """Test that an abbreviation followed by lowercase text isn't a break"""
+        assert _split_sentences("Bring fruit, e.g. apples. Thanks.") == [
+            "Bring fruit, e.g. apples.",
+            "Thanks.",
+        ]
+
+    def test_title_glued_to_name(self):
+        """Test that a title stays with the name after it"""
+        assert _split_sentences("Ask Mr. Smith. He knows.") == [
+            "Ask Mr. Smith.",
+            "He knows.",
+        ]
+
+    def test_abbreviation_can_end_a_sentence(self):
+        """Test that an abbreviation before a capitalized sentence is a break"""
+        assert _split_sentences("I live on Main St. It is quiet.") == [
+            "I live on Main St.",
+            "It is quiet.",
+        ]
+
+    def test_ellipsis(self):
+        """Test that an ellipsis followed by whitespace ends a sentence"""
+        assert _split_sentences("Well... I suppose. Fine.") == [
+            "Well...",
+            "I suppose.",
+            "Fine.",
+        ]
+
+    def test_cjk_punctuation(self):
+        """Test that full-width end punctuation splits without whitespace"""
+        assert _split_sentences("你好。今天怎么样？很好！") == [
+            "你好。",
+            "今天怎么样？",
+            "很好！",
+        ]
+
+
+class TestETag:
+    """Test ETag revalidation on cached JSON endpoints"""
+
+    @pytest.fixture
+    def backgrounds_client(self, webtool_client, mock_service_context, tmp_path):
+        """Serve /api/backgrounds from a directory holding one image"""
+        (tmp_path / "room.png").write_bytes(b"")
+        mock_service_context.system_config = MagicMock()
+        mock_service_context.system_config.get_backgrounds_path.return_value = tmp_path
+        return webtool_client
+
+    def test_response_carries_etag(self, backgrounds_client):
+        """Test that the first response includes an ETag alongside the payload"""
+        response = backgrounds_client.get("/api/backgrounds")
+
+        assert response.status_code == 200
+        assert response.headers["ETag"].startswith('"')
+        assert response.json() == [{"name": "room", "path": "/bg/room.png"}]
+
+    def test_matching_if_none_match_returns_304(self, backgrounds_client):
+        """Test that revalidating with the current ETag yields an empty 304"""
+        etag = backgrounds_client.get("/api/backgrounds").headers["ETag"]
+
+        response = backgrounds_client.get(
+            "/api/backgrounds", headers={"If-None-Match": etag}
+        )
+
+        assert response.status_code == 304
+        assert response.headers["ETag"] == etag
+        assert response.content == b""
+
+    def test_stale_if_none_match_returns_body(self, backgrounds_client):
+        """Test that an outdated ETag gets the full payload"""
+        response = backgrounds_client.get(
+            "/api/backgrounds", headers={"If-None-Match": '"stale"'}
+        )
+
+        assert response.status_code == 200
+        assert response.json() == [{"name": "room", "path": "/bg/room.png"}]
@@ -1,19 +1,23 @@
 """Unit tests for new WebSocket handlers"""
 
+import asyncio
 import pytest
 import json
+import numpy as np
 from unittest.mock import AsyncMock, MagicMock, patch
-from fastapi import WebSocket
+from fastapi import WebSocketDisconnect
 
 from src.open_llm_vtuber.websocket_handler import WebSocketHandler
 from src.open_llm_vtuber.service_context import ServiceContext
-from src.open_llm_vtuber.adapters import OrphiqAdapter
+from src.open_llm_vtuber.adapters import BackendAdapter, OrphiqAdapter
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def mock_service_context():
-    """Create a mock service context"""
-    context = MagicMock(spec=ServiceContext)
+    """Create a mock service context, shared by the tests in this module"""
+    # Specced from an instance, as the attributes are assigned in __init__.
+    # Building the spec walks the class, so it's done once per module.
+    context = MagicMock(spec=ServiceContext())
     context.character_config.character_name = "TestCharacter"
     context.character_config.human_name = "Human"
     context.character_config.avatar = "test.png"
@@ -23,12 +27,27 @@ def mock_service_context():
     return context
 
 
+@pytest.fixture(autouse=True)
+def _reset_mocks(mock_service_context):
+    """Clear calls recorded on the shared service context after each test"""
+    yield
+    mock_service_context.reset_mock()
+
+
+class _FakeWebSocket:
+    """The parts of a WebSocket the handlers use, without speccing the class"""
+
+    def __init__(self):
+        self.send_text = AsyncMock()
+        self.send_bytes = AsyncMock()
+        self.receive = AsyncMock()
+        self.close = AsyncMock()
+
+
 @pytest.fixture
 def mock_websocket():
-    """Create a mock WebSocket"""
-    ws = AsyncMock(spec=WebSocket)
-    ws.send_text = AsyncMock()
-    return ws
+    """Create a fake WebSocket"""
+    return _FakeWebSocket()
 
 
 @pytest.fixture
@@ -43,6 +62,23 @@ def client_uid():
     return "test-client-123"
 
 
+class _StubAdapter(BackendAdapter):
+    """Adapter streaming a fixed two-chunk reply"""
+
+    async def generate_text(self, prompt, context=None):
+        yield "Hello, "
+        yield "world!"
+
+    async def trigger_expression(self, *args, **kwargs):
+        return {}
+
+    async def trigger_motion(self, *args, **kwargs):
+        return {}
+
+    async def get_character_state(self):
+        return {}
+
+
 class TestWebSocketHandlers:
     """Test new WebSocket message handlers"""
 
@@ -81,6 +117,7 @@ class TestWebSocketHandlers:
         call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["type"] == "expression-ack"
         assert call_args["expression_id"] == 0
+        assert call_args["result"] == mock_adapter.trigger_expression.return_value
 
     @pytest.mark.asyncio
     async def test_expression_command_missing_id(
@@ -131,6 +168,8 @@ class TestWebSocketHandlers:
         call_args = json.loads(mock_websocket.send_text.call_args[0][0])
         assert call_args["type"] == "motion-ack"
         assert call_args["motion_group"] == "idle"
+        assert call_args["motion_index"] == 0
+        assert call_args["result"] == mock_adapter.trigger_motion.return_value
 
     @pytest.mark.asyncio
     async def test_text_generation_request_handler(
@@ -139,15 +178,7 @@ class TestWebSocketHandlers:
         """Test text generation request handler"""
         websocket_handler.client_connections[client_uid] = mock_websocket
         websocket_handler.client_contexts[client_uid] = mock_service_context
-        
-        mock_adapter = AsyncMock()
-        
-        async def mock_generate_text(prompt, context=None):
-            yield "Hello, "
-            yield "world!"
-        
-        mock_adapter.generate_text = mock_generate_text
-        websocket_handler.client_adapters[client_uid] = mock_adapter
+        websocket_handler.client_adapters[client_uid] = _StubAdapter()
         
         data = {
             "type": "text-generation-request",
@@ -158,16 +189,46 @@ class TestWebSocketHandlers:
             mock_websocket, client_uid, data
         )
         
-        # Should have sent chunks and final response
-        assert mock_websocket.send_text.call_count >= 2
-        
+        # One frame per chunk the adapter yields, then the final response
+        assert mock_websocket.send_bytes.call_count == 3
+        chunk_data = json.loads(mock_websocket.send_bytes.call_args_list[0][0][0])
+        assert chunk_data["type"] == "text-generation-chunk"
+        assert chunk_data["text"] == "Hello, "
+
         # Check final response
-        final_call = mock_websocket.send_text.call_args_list[-1]
+        final_call = mock_websocket.send_bytes.call_args_list[-1]
         final_data = json.loads(final_call[0][0])
         assert final_data["type"] == "text-generation-response"
         assert final_data["is_complete"] is True
         assert "Hello, world!" in final_data["text"]
 
+    @pytest.mark.asyncio
+    async def test_text_generation_propagates_cancellation(
+        self, websocket_handler, mock_websocket, client_uid, mock_service_context
+    ):
+        """Test that a generator cancelled mid-stream doesn't stall the handler"""
+
+        class _CancelledAdapter(_StubAdapter):
+            async def generate_text(self, prompt, context=None):
+                yield "hi"
+                raise asyncio.CancelledError
+
+        websocket_handler.client_connections[client_uid] = mock_websocket
+        websocket_handler.client_contexts[client_uid] = mock_service_context
+        websocket_handler.client_adapters[client_uid] = _CancelledAdapter()
+
+        with pytest.raises(asyncio.CancelledError):
+            await asyncio.wait_for(
+                websocket_handler._handle_text_generation_request(
+                    mock_websocket,
+                    client_uid,
+                    {"type": "text-generation-request", "prompt": "Say hello"},
+                ),
+                timeout=1,
+            )
+
+        mock_websocket.send_bytes.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_set_backend_mode_handler(
         self, websocket_handler, mock_websocket, client_uid, mock_service_context
@@ -244,3 +305,193 @@ class TestWebSocketHandlers:
         assert isinstance(adapter, OrphiqAdapter)
         assert client_uid in websocket_handler.client_adapters
 
+
+    @pytest.mark.asyncio
+    async def test_adapter_send_closes_stalled_client(
+        self, websocket_handler, mock_websocket, client_uid, mock_service_context
+    ):
+        """Test that a send blocked past the timeout closes the connection"""
+        websocket_handler.client_connections[client_uid] = mock_websocket
+        websocket_handler.client_contexts[client_uid] = mock_service_context
+
+        async def stalled_send(msg):
+            await asyncio.sleep(1)
+
+        mock_websocket.send_bytes = AsyncMock(side_effect=stalled_send)
+        adapter = websocket_handler._get_adapter(client_uid)
+
+        with patch("src.open_llm_vtuber.chat_group.WS_SEND_TIMEOUT", 0.01):
+            with pytest.raises(asyncio.TimeoutError):
+                await adapter.websocket_send(b"{}")
+
+        mock_websocket.close.assert_awaited_once()
+        assert mock_websocket.close.call_args.kwargs["code"] == 1008
+
+    @pytest.mark.asyncio
+    async def test_text_generation_closes_stalled_client(
+        self, websocket_handler, mock_websocket, client_uid, mock_service_context
+    ):
+        """Test that text generation frames are subject to the send timeout"""
+        websocket_handler.client_connections[client_uid] = mock_websocket
+        websocket_handler.client_contexts[client_uid] = mock_service_context
+        websocket_handler.client_adapters[client_uid] = _StubAdapter()
+
+        async def stalled_send(msg):
+            await asyncio.sleep(1)
+
+        mock_websocket.send_bytes = AsyncMock(side_effect=stalled_send)
+
+        with patch("src.open_llm_vtuber.chat_group.WS_SEND_TIMEOUT", 0.01):
+            await websocket_handler._handle_text_generation_request(
+                mock_websocket,
+                client_uid,
+                {"type": "text-generation-request", "prompt": "Say hello"},
+            )
+
+        mock_websocket.close.assert_awaited_once()
+        assert mock_websocket.close.call_args.kwargs["code"] == 1008
+        mock_websocket.send_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_new_connection_sends_one_group_update(
+        self,
+        websocket_handler,
+        mock_websocket,
+        client_uid,
+        mock_service_context,
+        monkeypatch,
+    ):
+        """Test that a new client gets a single group update before start-mic"""
+        monkeypatch.setattr(mock_service_context.live2d_model, "model_info", {})
+        monkeypatch.setattr(
+            mock_service_context.character_config, "conf_name", "test-conf"
+        )
+        websocket_handler._init_service_context = AsyncMock(
+            return_value=mock_service_context
+        )
+
+        await websocket_handler.handle_new_connection(mock_websocket, client_uid)
+
+        sent = [json.loads(c[0][0]) for c in mock_websocket.send_text.call_args_list]
+        types = [message["type"] for message in sent]
+        assert types.count("group-update") == 1
+        assert types.index("group-update") < types.index("control")
+        assert sent[-1] == {"type": "control", "text": "start-mic"}
+        assert sent[1] == {
+            "type": "set-model-and-conf",
+            "model_info": {},
+            "conf_name": "test-conf",
+            "conf_uid": "test-conf-uid",
+            "client_uid": client_uid,
+        }
+
+    @pytest.mark.asyncio
+    async def test_new_connection_sees_reloaded_model_info(
+        self,
+        websocket_handler,
+        mock_websocket,
+        client_uid,
+        mock_service_context,
+        monkeypatch,
+    ):
+        """Test that a model reloaded under the same config isn't served stale"""
+        live2d_model = mock_service_context.live2d_model
+        monkeypatch.setattr(live2d_model, "model_info", {"name": "old"})
+        monkeypatch.setattr(
+            mock_service_context.character_config, "conf_name", "test-conf"
+        )
+        websocket_handler._init_service_context = AsyncMock(
+            return_value=mock_service_context
+        )
+        await websocket_handler.handle_new_connection(mock_websocket, client_uid)
+        mock_websocket.send_text.reset_mock()
+
+        monkeypatch.setattr(live2d_model, "model_info", {"name": "new"})
+        await websocket_handler.handle_new_connection(mock_websocket, "client-2")
+
+        sent = json.loads(mock_websocket.send_text.call_args_list[1][0][0])
+        assert sent["type"] == "set-model-and-conf"
+        assert sent["model_info"] == {"name": "new"}
+        assert sent["client_uid"] == "client-2"
+
+    def test_binary_audio_is_buffered_as_float(self, websocket_handler, client_uid):
+        """Test that binary int16 PCM frames are buffered as scaled float32"""
+        websocket_handler.received_data_buffers[client_uid] = []
+        payload = np.array([0, 16384, -32768], dtype="<i2").tobytes()
+
+        websocket_handler._handle_binary_audio(client_uid, payload)
+
+        (chunk,) = websocket_handler.received_data_buffers[client_uid]
+        assert chunk.dtype == np.float32
+        np.testing.assert_allclose(chunk, [0.0, 0.5, -1.0])
+
+    @pytest.mark.asyncio
+    async def test_non_object_json_is_ignored(
+        self, websocket_handler, mock_websocket, client_uid
+    ):
+        """Test that JSON frames that aren't objects are dropped without a reply"""
+        mock_websocket.receive = AsyncMock(
+            side_effect=[
+                {"type": "websocket.receive", "text": "[1, 2]"},
+                {"type": "websocket.disconnect", "code": 1000},
+            ]
+        )
+
+        with pytest.raises(WebSocketDisconnect):
+            await websocket_handler.handle_websocket_communication(
+                mock_websocket, client_uid
+            )
+
+        mock_websocket.send_text.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_raw_audio_runs_vad_in_worker(
+        self,
+        websocket_handler,
+        mock_websocket,
+        client_uid,
+        mock_service_context,
+        monkeypatch,
+    ):
+        """Test that raw audio is run through VAD by the client's worker task"""
+        websocket_handler.client_contexts[client_uid] = mock_service_context
+        websocket_handler.received_data_buffers[client_uid] = []
+        speech = np.zeros(1024, dtype=np.int16).tobytes()
+        monkeypatch.setattr(
+            mock_service_context.vad_engine,
+            "detect_speech",
+            MagicMock(return_value=iter([speech])),
+        )
+
+        await websocket_handler._handle_raw_audio_data(
+            mock_websocket, client_uid, {"type": "raw-audio-data", "audio": [0.0]}
+        )
+        for _ in range(100):
+            if mock_websocket.send_text.called:
+                break
+            await asyncio.sleep(0.01)
+
+        assert len(websocket_handler.received_data_buffers[client_uid]) == 1
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert call_args == {"type": "control", "text": "mic-audio-end"}
+
+        await websocket_handler.handle_disconnect(client_uid)
+        assert client_uid not in websocket_handler._vad_workers
+
+    @pytest.mark.asyncio
+    async def test_fetch_backgrounds_is_cached(
+        self, websocket_handler, mock_websocket, client_uid
+    ):
+        """Test that repeated background fetches reuse one directory scan"""
+        with patch(
+            "src.open_llm_vtuber.websocket_handler.scan_bg_directory",
+            return_value=["bg.png"],
+        ) as scan:
+            for _ in range(2):
+                await websocket_handler._handle_fetch_backgrounds(
+                    mock_websocket, client_uid, {"type": "fetch-backgrounds"}
+                )
+
+        assert scan.call_count == 1
+        call_args = json.loads(mock_websocket.send_text.call_args[0][0])
+        assert call_args == {"type": "background-files", "files": ["bg.png"]}
@@ -42,6 +42,9 @@ interface WebSocketContextType {
 
 const WebSocketContext = createContext<WebSocketContextType | undefined>(undefined);
 
+// The backend may send pre-encoded JSON as binary frames
+const frameDecoder = new TextDecoder();
+
 interface WebSocketProviderProps {
   children: ReactNode | ((context: WebSocketContextType) => ReactNode);
 }
@@ -166,6 +169,7 @@ export const WebSocketProvider = ({ children }: WebSocketProviderProps) => {
         }, 5000);
         
         const newSocket = new WebSocket(wsUrl);
+        newSocket.binaryType = 'arraybuffer';
         
         newSocket.onopen = () => {
           console.log('WebSocket connection established:', {
@@ -191,7 +195,8 @@ export const WebSocketProvider = ({ children }: WebSocketProviderProps) => {
         
         newSocket.onmessage = (event) => {
           try {
-            const data = JSON.parse(event.data);
+            const raw = typeof event.data === 'string' ? event.data : frameDecoder.decode(event.data);
+            const data = JSON.parse(raw);
             
             // Handle client ID assignment
             if (data.client_uid) {
@@ -3,10 +3,14 @@
 Development script to run both frontend and backend concurrently.
 """
 
+import argparse
 import subprocess
 import sys
 import os
+import select
 import signal
+import selectors
+import threading
 import time
 from pathlib import Path
 
@@ -15,6 +19,11 @@ PROJECT_ROOT = Path(__file__).parent.absolute()
 FRONTEND_DIR = PROJECT_ROOT / "frontend"
 BACKEND_DIR = PROJECT_ROOT / "backend"
 
+# Most bytes taken from a child's output pipe per os.read. This only affects
+# the reading side: how promptly a child's lines show up depends on the child
+# flushing its own output.
+PIPE_READ_SIZE = 65536
+
 # Store process references for cleanup
 processes = []
 
@@ -41,7 +50,18 @@ def signal_handler(sig, frame):
     sys.exit(0)
 
 
-def run_frontend():
+def _output_options(raw):
+    """Popen options for a child's output: inherited as-is, or piped for prefixing."""
+    if raw:
+        return {}
+    return {
+        "stdout": subprocess.PIPE,
+        "stderr": subprocess.STDOUT,
+        "text": True,
+    }
+
+
+def run_frontend(raw=False):
     """Run the Next.js frontend development server."""
     print("🚀 Starting frontend (Next.js)...")
     print(f"   Directory: {FRONTEND_DIR}")
@@ -58,10 +78,7 @@ def run_frontend():
         process = subprocess.Popen(
             ["npm", "run", "dev"],
             cwd=str(FRONTEND_DIR),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
+            **_output_options(raw)
         )
         return process
     except Exception as e:
@@ -69,7 +86,7 @@ def run_frontend():
         return None
 
 
-def run_backend():
+def run_backend(raw=False):
     """Run the orphiq backend server."""
     print("🚀 Starting backend (Orphiq)...")
     print(f"   Directory: {BACKEND_DIR}")
@@ -89,10 +106,7 @@ def run_backend():
         process = subprocess.Popen(
             ["python", "cli.py", "run"],
             cwd=str(BACKEND_DIR),
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
-            bufsize=1
+            **_output_options(raw)
         )
         return process
     except Exception as e:
@@ -100,6 +114,51 @@ def run_backend():
         return None
 
 
+def stream_output(named_processes):
+    """
+    Print prefixed output from several processes on one thread, until one of
+    them exits. Returns the name of the process that ended.
+    """
+    selector = selectors.DefaultSelector()
+    for process, prefix in named_processes:
+        fd = process.stdout.fileno()
+        os.set_blocking(fd, False)
+        # data holds the prefix and any partial line read so far
+        selector.register(fd, selectors.EVENT_READ, [prefix, b""])
+    
+    wakeup = _child_exit_fd()
+    if wakeup is not None:
+        selector.register(wakeup, selectors.EVENT_READ, None)
+    
+    try:
+        while True:
+            ended = _first_ended(named_processes)
+            if ended:
+                return ended
+            
+            for key, _ in selector.select(timeout=None if wakeup is not None else 1.0):
+                state = key.data
+                if state is None:
+                    _drain(wakeup)
+                    continue
+                try:
+                    chunk = os.read(key.fd, PIPE_READ_SIZE)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    if state[1]:
+                        print(f"[{state[0]}] {state[1].decode(errors='replace').rstrip()}")
+                    selector.unregister(key.fd)
+                    continue
+                lines = (state[1] + chunk).split(b"\n")
+                state[1] = lines.pop()
+                for line in lines:
+                    print(f"[{state[0]}] {line.decode(errors='replace').rstrip()}")
+    finally:
+        selector.close()
+        _close_child_exit_fd(wakeup)
+
+
 def print_output(process, prefix):
     """Print output from a process with a prefix."""
     if process is None:
@@ -115,8 +174,90 @@ def print_output(process, prefix):
         print(f"[{prefix}] Error reading output: {e}")
 
 
+def watch_with_threads(named_processes):
+    """
+    Print prefixed output from each process on its own thread, until one of
+    them exits. Returns the name of the process that ended.
+    """
+    for process, prefix in named_processes:
+        threading.Thread(target=print_output, args=(process, prefix), daemon=True).start()
+    
+    return wait_for_exit(named_processes)
+
+
+def wait_for_exit(named_processes):
+    """Wait until one of the processes exits and return its name."""
+    wakeup = _child_exit_fd()
+    try:
+        while True:
+            ended = _first_ended(named_processes)
+            if ended:
+                return ended
+            if wakeup is None:
+                time.sleep(1)
+            else:
+                select.select([wakeup], [], [])
+                _drain(wakeup)
+    finally:
+        _close_child_exit_fd(wakeup)
+
+
+def _first_ended(named_processes):
+    """Name of the first process that has exited, or None."""
+    for process, prefix in named_processes:
+        if process.poll() is not None:
+            return prefix
+    return None
+
+
+def _child_exit_fd():
+    """
+    A pipe read end that becomes readable when a signal arrives, SIGCHLD
+    included, so a child's exit wakes the caller instead of being polled
+    for. None where SIGCHLD doesn't exist (Windows).
+    """
+    if not hasattr(signal, "SIGCHLD"):
+        return None
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(read_fd, False)
+    os.set_blocking(write_fd, False)
+    # The wakeup fd is only written for signals that have a Python handler
+    signal.signal(signal.SIGCHLD, lambda sig, frame: None)
+    signal.set_wakeup_fd(write_fd)
+    return read_fd
+
+
+def _close_child_exit_fd(read_fd):
+    if read_fd is None:
+        return
+    os.close(signal.set_wakeup_fd(-1))
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    os.close(read_fd)
+
+
+def _drain(fd):
+    """Empty a non-blocking pipe of pending wakeup bytes."""
+    try:
+        while os.read(fd, 512):
+            pass
+    except BlockingIOError:
+        pass
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Run the frontend and backend dev servers")
+    parser.add_argument(
+        "--raw",
+        action="store_true",
+        help="Let both servers write straight to this terminal, without [FRONTEND]/[BACKEND] prefixes",
+    )
+    return parser.parse_args()
+
+
 def main():
     """Main function to run both services."""
+    args = parse_args()
+    
     # Set up signal handlers for graceful shutdown
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
@@ -127,7 +268,7 @@ def main():
     print()
     
     # Start frontend
-    frontend_process = run_frontend()
+    frontend_process = run_frontend(raw=args.raw)
     if frontend_process:
         processes.append(frontend_process)
         print(f"   ✅ Frontend started (PID: {frontend_process.pid})")
@@ -140,7 +281,7 @@ def main():
     print()
     
     # Start backend
-    backend_process = run_backend()
+    backend_process = run_backend(raw=args.raw)
     if backend_process:
         processes.append(backend_process)
         print(f"   ✅ Backend started (PID: {backend_process.pid})")
@@ -159,34 +300,16 @@ def main():
     
     # Monitor processes and print output
     try:
-        import threading
-        
-        # Create threads to print output from each process
-        frontend_thread = threading.Thread(
-            target=print_output,
-            args=(frontend_process, "FRONTEND"),
-            daemon=True
-        )
-        backend_thread = threading.Thread(
-            target=print_output,
-            args=(backend_process, "BACKEND"),
-            daemon=True
-        )
-        
-        frontend_thread.start()
-        backend_thread.start()
-        
-        # Wait for processes to complete
-        while True:
-            # Check if processes are still running
-            if frontend_process.poll() is not None:
-                print("\n⚠️  Frontend process ended")
-                break
-            if backend_process.poll() is not None:
-                print("\n⚠️  Backend process ended")
-                break
-            
-            time.sleep(1)
+        named_processes = [(frontend_process, "FRONTEND"), (backend_process, "BACKEND")]
+        if args.raw:
+            # Output goes straight to the inherited terminal; nothing to read
+            ended = wait_for_exit(named_processes)
+        elif os.name == "nt":
+            # Windows can't select on pipes, so read each one on its own thread
+            ended = watch_with_threads(named_processes)
+        else:
+            ended = stream_output(named_processes)
+        print(f"\n⚠️  {ended.capitalize()} process ended")
     
     except KeyboardInterrupt:
         pass